@@ -11,6 +11,7 @@ import tempfile                   # Import tempfile to create temporary files an
 import os                         # Import os for file and directory operations.
 import json                       # Import json to read/write JSON files.
 import csv                        # Import csv for CSV file operations.
+import time                       # Import time to wait for work done on background threads.
 import tkinter as tk              # Import tkinter for GUI operations (used in the main application).
 from tkinter import ttk           # Import ttk for themed tkinter widgets.
 from unittest.mock import patch   # Import patch to replace parts of the system under test with mock objects.
@@ -32,6 +33,9 @@ class TestAlbumCatalogApp(unittest.TestCase):
         # Override the file paths in the main module to point to our temporary files.
         main.USERS_JSON = self.users_file
         main.ALBUMS_CSV = self.albums_file
+        # Keep the parsed album cache in the temporary directory too, restoring the real path afterwards.
+        self.original_albums_pickle = main.ALBUMS_PICKLE
+        main.ALBUMS_PICKLE = os.path.join(self.test_dir.name, "albums.pkl")
 
         # Write a sample album CSV file with one album entry for testing.
         with open(self.albums_file, "w", newline="", encoding="utf-8") as f:
@@ -78,6 +82,8 @@ class TestAlbumCatalogApp(unittest.TestCase):
         self.app = main.AlbumCatalogApp()
         # Withdraw the window to keep tests headless (no GUI shown).
         self.app.withdraw()
+        # Wait for the background album load, so it does not write its cache while the temporary files are removed.
+        self.app.albums
 
     def tearDown(self):
         """
@@ -88,6 +94,7 @@ class TestAlbumCatalogApp(unittest.TestCase):
         self.patcher_toplevel.stop()
         # Destroy the application instance to clean up resources.
         self.app.destroy()
+        main.ALBUMS_PICKLE = self.original_albums_pickle
         # Clean up the temporary directory.
         self.test_dir.cleanup()
 
@@ -388,7 +395,8 @@ class TestAlbumCatalogApp(unittest.TestCase):
                 break
         # Verify that the username has been updated and the new password is set.
         self.assertIn("editeduser", self.app.users, "Username should be updated to 'editeduser'.")
-        self.assertEqual(self.app.users["editeduser"]["password"], "newpass", "Password should be updated to 'newpass'.")
+        self.assertTrue(main.verify_password(self.app.users["editeduser"]["password"], "newpass"),
+                        "Password should be updated to 'newpass'.")
 
     def test_logout_functionality(self):
         """
@@ -593,9 +601,9 @@ class TestAlbumCatalogApp(unittest.TestCase):
 
     def test_threadpool_executor_usage(self):
         """
-        OB Test 18: Confirm that the thread pool executor submits one task per album when refreshing the album list.
+        OB Test 18: Confirm that the thread pool executor submits one task per album whose cover is not yet loaded when refreshing the album list.
         """
-        # Set up a single album for testing.
+        # Set up a single album with a cover that has not been loaded yet.
         self.app.albums = [{
             "Ranking": "1",
             "Album": "Threaded Album",
@@ -605,7 +613,7 @@ class TestAlbumCatalogApp(unittest.TestCase):
             "Average Rating": "4",
             "Number of Ratings": "80",
             "Number of Reviews": "40",
-            "Cover URL": "",
+            "Cover URL": "threaded_cover.png",
             "Tracklist": "",
             "Deezer_ID": ""
         }]
@@ -846,5 +854,124 @@ class TestAlbumCatalogApp(unittest.TestCase):
             catalog_frame.unfavourite_album()
             mock_showerror.assert_called_once_with("Error", f"Album '{album['Album']}' is not in your favourites.")
 
+    def test_edit_and_delete_album_from_search_results(self):
+        """
+        OB Test 28: Verify that editing and deleting from search results change the selected album, not the catalog album at the same position.
+        """
+        # Ensure the user is logged in.
+        self.app.current_user = "testuser"
+        main.current_user = "testuser"
+        main.is_logged_in = True
+
+        # Set up two albums; only the second one will be shown as a search result.
+        first_album = {
+            "Ranking": "1", "Album": "First Album", "Artist Name": "First Artist", "Release Date": "2020-01-01",
+            "Genres": "Rock", "Average Rating": "4", "Number of Ratings": "80", "Number of Reviews": "40",
+            "Cover URL": "", "Tracklist": "", "Deezer_ID": "1"
+        }
+        second_album = {
+            "Ranking": "2", "Album": "Second Album", "Artist Name": "Second Artist", "Release Date": "2021-01-01",
+            "Genres": "Pop", "Average Rating": "5", "Number of Ratings": "90", "Number of Reviews": "45",
+            "Cover URL": "", "Tracklist": "", "Deezer_ID": "2"
+        }
+        self.app.albums = [first_album, second_album]
+        self.app.search_results = [second_album]
+        catalog_frame = self.app.frames["CatalogFrame"]
+        catalog_frame.refresh_album_list()
+        # Select the only search result, which is the second catalog album.
+        catalog_frame.selected_album = catalog_frame.album_items[0]
+
+        # Edit the selected album's artist.
+        self.created_toplevels.clear()
+        catalog_frame.edit_album(True)
+        edit_win = self.created_toplevels[-1]
+        entry_widgets = [child for child in edit_win.winfo_children() if isinstance(child, (tk.Entry, ttk.Entry))]
+        entry_widgets[0].delete(0, tk.END)
+        entry_widgets[0].insert(0, "Edited Artist")
+        buttons = [child for child in edit_win.winfo_children() if isinstance(child, ttk.Button)]
+        for btn in buttons:
+            if "Update Album" in btn.cget("text"):
+                btn.invoke()
+                break
+        # Verify that the search result was edited and the first catalog album was left alone.
+        self.assertEqual(second_album["Artist Name"], "Edited Artist", "The selected search result should be edited.")
+        self.assertEqual(first_album["Artist Name"], "First Artist", "The first catalog album should be unchanged.")
+
+        # Delete the selected album.
+        catalog_frame.selected_album = catalog_frame.album_items[0]
+        with patch("main.messagebox.askyesno", return_value=True):
+            catalog_frame.delete_album(True)
+        # Verify that only the selected album was removed, from both the catalog and the results shown.
+        self.assertEqual(self.app.albums, [first_album], "Only the selected album should be deleted.")
+        self.assertEqual(self.app.search_results, [], "The deleted album should leave the search results.")
+
+    def test_album_cache_invalidated_by_changed_csv(self):
+        """
+        CB Test 29: Verify that load_albums_from_csv() parses the CSV again once it has changed since it was cached.
+        """
+        # The first load caches the parsed albums.
+        self.assertEqual(len(self.app.load_albums_from_csv()), 1, "Expected one album in CSV")
+        self.assertTrue(os.path.exists(main.ALBUMS_PICKLE), "The parsed albums should be cached")
+        # Append a second album, which changes the CSV's size and modification time.
+        with open(self.albums_file, "a", newline="", encoding="utf-8") as f:
+            csv.writer(f).writerow(["2", "Second Album", "Second Artist", "2022-02-02", "Rock", "4", "10", "5", ""])
+        albums = self.app.load_albums_from_csv()
+        self.assertEqual([album["Album"] for album in albums], ["Test Album", "Second Album"],
+                         "A changed CSV should not be served from the cache")
+
+    def test_startup_cover_prefetch(self):
+        """
+        OB Test 30: Verify that the covers of the first albums are prefetched once the background album load finishes.
+        """
+        # Write a catalog whose albums have web cover URLs.
+        with open(self.albums_file, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(main.ALBUM_FIELDS)
+            for i in range(3):
+                album = {"Ranking": str(i + 1), "Album": f"Album {i}", "Cover URL": f"https://example.com/{i}.jpg"}
+                writer.writerow([album.get(field, "") for field in main.ALBUM_FIELDS])
+        # Patch the cover download so no network access is needed.
+        with patch("main.load_remote_cover", return_value=Image.new("RGB", (150, 150))):
+            app = main.AlbumCatalogApp()
+            self.addCleanup(app.destroy)
+            # Wait for the background load, then pump Tk events until the event loop has picked up its result.
+            app._albums_future.result()
+            deadline = time.monotonic() + 10
+            while not app.cover_prefetches and time.monotonic() < deadline:
+                time.sleep(0.01)
+                app.update()
+            self.assertEqual(sorted(app.cover_prefetches), [f"https://example.com/{i}.jpg" for i in range(3)],
+                             "The first covers should be prefetched once the albums are loaded.")
+
+    def test_edit_account_hashed_password(self):
+        """
+        OB Test 31: Verify that editing an account with a hashed password checks it off the Tk thread and then updates the account.
+        """
+        # Set up a user whose password is stored hashed.
+        self.app.users = {"hasheduser": {"password": main.hash_password("oldpass"), "email": "hash@example.com"}}
+        self.app.current_user = "hasheduser"
+        main.current_user = "hasheduser"
+        main.is_logged_in = True
+        # Open the edit account window and fill in the current password and a new username.
+        self.created_toplevels.clear()
+        catalog_frame = self.app.frames["CatalogFrame"]
+        catalog_frame.edit_account()
+        edit_win = self.created_toplevels[-1]
+        entries = [child for child in edit_win.winfo_children() if isinstance(child, (tk.Entry, ttk.Entry))]
+        entries[0].insert(0, "oldpass")
+        entries[1].insert(0, "renameduser")
+        buttons = [child for child in edit_win.winfo_children() if isinstance(child, ttk.Button)]
+        update_button = next(btn for btn in buttons if "Update Account" in btn.cget("text"))
+        update_button.invoke()
+        # The password check runs in the background; the button is disabled until it is done.
+        self.assertEqual(str(update_button.cget("state")), "disabled", "Update Account should wait for the password check.")
+        # Pump Tk events until the account has been updated.
+        deadline = time.monotonic() + 10
+        while "renameduser" not in self.app.users and time.monotonic() < deadline:
+            time.sleep(0.01)
+            self.app.update()
+        self.assertIn("renameduser", self.app.users, "Username should be updated once the password is verified.")
+        self.assertEqual(str(update_button.cget("state")), "normal", "Update Account should be enabled again.")
+
 if __name__ == '__main__':
     unittest.main()
@@ -7,19 +7,72 @@ from tkinter import ttk                   # For themed widgets.
 from tkinter import filedialog            # For file dialogs (open/save dialogs).
 import csv                                # For CSV file operations.
 import json                               # For JSON file operations.
+import pickle                             # For the parsed album cache stored next to the CSV.
 import os                                 # For operating system interactions (e.g., file checking).
+import sys                                # For interning repeated strings.
 from PIL import Image, ImageTk            # Pillow for image processing and interfacing with Tkinter images.
 import re                                 # For regular expressions.
 from urllib.request import urlopen, Request # For making HTTP requests to fetch resources from the web.
+from urllib.parse import urlsplit         # For splitting cover URLs into host and path.
+import http.client                        # For persistent (keep-alive) HTTP connections.
 import io                                 # For in-memory I/O operations.
+import hashlib                            # For naming cached cover files after their URL, and hashing passwords.
+import hmac                               # For comparing password hashes in constant time.
 import threading                         # For multi-threading operations.
+import queue                              # For handing results from worker threads to the Tk thread.
+import logging                            # For debug output that is off unless logging is configured for it.
+from bisect import bisect_right           # For mapping search hits in a joined column back to rows.
+from itertools import accumulate          # For computing row offsets in a joined column.
+from functools import lru_cache           # For memoizing URL checks per Cover URL.
+from collections import OrderedDict      # For the least-recently-used album cover cache.
 from concurrent.futures import ThreadPoolExecutor  # For managing a pool of threads (fixed-size thread pool).
 
 # ---------------------------------------------------------------------------
 # Define constants for file paths and theme colours
 # ---------------------------------------------------------------------------
+APP_BASE_DIR = os.getcwd()                         # Directory the "./Code/..." paths are relative to, read once at startup.
 USERS_JSON = "./Code/users.json"               # File path for storing user login data in JSON format.
 ALBUMS_CSV = "./Code/cleaned_music_data.csv"       # File path for storing album catalog data in CSV format.
+ALBUMS_PICKLE = "./Code/cleaned_music_data.pkl"    # Parsed copy of the album CSV, reused while the CSV is unchanged.
+SAVE_DELAY_MS = 500                                # Delay after the last change before users/albums are written.
+SEARCH_DELAY_MS = 120                              # Delay after the last Enter press in the search bar before searching.
+COVER_CACHE_DIR = "./Code/cover_cache"             # Directory for downloaded album covers, stored as thumbnails.
+
+# Column order of the album catalog CSV (and the keys of each album dictionary).
+ALBUM_FIELDS = ("Ranking", "Album", "Artist Name", "Release Date", "Genres", "Average Rating",
+                "Number of Ratings", "Number of Reviews", "Cover URL", "Tracklist", "Deezer_ID")
+TRACKLIST_COLUMN = ALBUM_FIELDS.index("Tracklist")
+# Album fields whose values repeat across many albums; loaded values are interned so repeats share one string.
+INTERNED_ALBUM_FIELDS = ("Artist Name", "Genres", "Release Date")
+
+# Text fields of the add/edit album form as (album field, label text), in grid row order.
+ALBUM_FORM_FIELDS = (("Artist Name", "Artist Name:"), ("Album", "Album:"),
+                     ("Release Date", "Release Date:"), ("Genres", "Genres:"))
+
+# File types offered by the album cover file dialog.
+ALBUM_COVER_FILETYPES = (("Image Files", "*.png *.jpg *.jpeg *.gif"), ("All Files", "*.*"))
+
+# Fields of a newly added album that the album form does not set.
+DEFAULT_ALBUM = {"Ranking": 0, "Average Rating": 0, "Number of Ratings": 0, "Number of Reviews": 0, "Deezer_ID": ""}
+
+# Number of covers at the top of the catalog downloaded into the disk cache during login.
+COVER_PREFETCH_COUNT = 10
+# Number of covers below the rendered album items fetched ahead of scrolling.
+COVER_PREFETCH_AHEAD = 10
+
+# Album covers kept in memory as PhotoImages; older ones are reloaded from the disk cache when needed again.
+COVER_MEMORY_CACHE_SIZE = 256
+
+# Worker threads for cover downloads; they mostly wait on the network. Override with the BB_THREADS environment variable.
+COVER_WORKERS = int(os.environ.get("BB_THREADS", 16))
+
+# Layout of the virtualized album list: only album items in or near the visible part of the canvas are rendered.
+ALBUM_ITEM_HEIGHT = 185   # Vertical pitch of one album item (150px cover, its border, and 15px padding above and below).
+ALBUM_ITEM_OVERSCAN = 2   # Extra album items rendered above and below the visible ones, so scrolling never shows gaps.
+
+# Album field searched by each option of the search filter dropdown.
+SEARCH_FILTER_FIELDS = {"Album Name": "Album", "Artist Name": "Artist Name",
+                        "Genres": "Genres", "Release Date": "Release Date"}
 
 # UI colour constants.
 PRIMARY_BACKGROUND_COLOUR = "#527cc5"       # Primary background colour used across the UI.
@@ -27,6 +80,9 @@ NAV_BAR_BACKGROUND_COLOUR = "#345db7"         # Background colour for the naviga
 NAV_BAR_SHADOW_1_COLOUR = "#244d97"           # First shadow colour for the navigation bar.
 NAV_BAR_SHADOW_2_COLOUR = "#143d87"           # Second shadow colour for the navigation bar.
 
+# URL prefixes that mark a cover as remote (anything else is a local file path).
+URL_SCHEMES = ("http://", "https://", "ftp://")
+
 # Precompile URL regex for efficiency.
 URL_PATTERN = re.compile(
     r'^(https?|ftp):\/\/'                      # Matches URL schemes: http, https, or ftp.
@@ -34,6 +90,12 @@ URL_PATTERN = re.compile(
     r'\b([-a-zA-Z0-9@:%_\+.~#?&//=]*)$'         # Matches optional paths, queries, and fragments.
 )
 
+# Precompile email regex used to validate sign-up emails.
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Module logger; debug messages are dropped at the default WARNING level.
+logger = logging.getLogger(__name__)
+
 # Global variable to track login state.
 current_user = None   # Holds the current user's data (e.g., username or user object).
 is_logged_in = False  # Boolean flag to indicate whether a user is logged in.
@@ -60,8 +122,7 @@ def login(username, password):
     
     for user in users:
         # Check for matching username and password.
-        # Note: In production, passwords should be hashed and securely verified.
-        if user['username'] == username and user['password'] == password:
+        if user['username'] == username and verify_password(user['password'], password):
             current_user = user   # Set the authenticated user as the current user.
             is_logged_in = True   # Update the global login state.
             return True          # Return True indicating successful login.
@@ -74,7 +135,7 @@ def logout():
     global current_user, is_logged_in  # Declare modification of global variables.
     current_user = None  # Reset the current user.
     is_logged_in = False  # Update the login state to logged out.
-    print(f"DEBUG: User logged out. is_logged_in = {is_logged_in}")  # Debug output.
+    logger.debug("User logged out. is_logged_in = %s", is_logged_in)
     messagebox.showinfo("Logout", "You have been logged out.")  # Show a pop-up informing the user.
     # The following lines reference self.controller and self.refresh_button;
     # note that 'self' is not defined in this global function which might be an oversight.
@@ -87,9 +148,152 @@ def logout():
 
 # Function to check if a user is currently logged in.
 def check_login():
-    print(f"DEBUG: check_login called, is_logged_in = {is_logged_in}, current_user = {current_user}")  # Debug output.
     return is_logged_in  # Return the current login state.
 
+# ---------------------------------------------------------------------------
+# Password helpers: passwords are stored as "scrypt$<salt hex>$<hash hex>", where
+# the hash is scrypt over the SHA-256 digest of the password.
+# Accounts saved before hashing still hold the plaintext password, which is
+# accepted and replaced with a hash on the next login or password change.
+# ---------------------------------------------------------------------------
+PASSWORD_HASH_PREFIX = "scrypt$"
+PASSWORD_SCRYPT_PARAMS = {"n": 2 ** 14, "r": 8, "p": 1}  # Roughly 50 ms per hash.
+
+def _password_key(password):
+    """Return the SHA-256 digest of password, which is what scrypt is run over (and what verifications are cached by)."""
+    return hashlib.sha256(password.encode("utf-8")).digest()
+
+def hash_password(password):
+    """Return a salted scrypt hash of password in the stored "scrypt$salt$hash" format."""
+    salt = os.urandom(16)
+    digest = hashlib.scrypt(_password_key(password), salt=salt, **PASSWORD_SCRYPT_PARAMS)
+    return f"{PASSWORD_HASH_PREFIX}{salt.hex()}${digest.hex()}"
+
+def is_password_hash(stored):
+    """Return whether a stored password is a hash (as opposed to a legacy plaintext password)."""
+    return stored.startswith(PASSWORD_HASH_PREFIX)
+
+@lru_cache(maxsize=128)
+def _scrypt_matches(stored, passwordKey):
+    """Return whether passwordKey matches the stored hash.
+    
+    Matches and mismatches are both cached, so repeating a check within a session skips the scrypt run.
+    """
+    salt, digest = stored[len(PASSWORD_HASH_PREFIX):].split("$")
+    candidate = hashlib.scrypt(passwordKey, salt=bytes.fromhex(salt), **PASSWORD_SCRYPT_PARAMS)
+    return hmac.compare_digest(candidate, bytes.fromhex(digest))
+
+def verify_password(stored, password):
+    """Return whether password matches the stored hash (or legacy plaintext password)."""
+    if not is_password_hash(stored):
+        return hmac.compare_digest(stored.encode("utf-8"), password.encode("utf-8"))
+    return _scrypt_matches(stored, _password_key(password))
+
+# ---------------------------------------------------------------------------
+# Tracklist helpers: albums keep their Tracklist as a list of track strings in
+# memory; the CSV stores it as a single "; "-separated string.
+# ---------------------------------------------------------------------------
+def split_tracklist(tracklist):
+    """Return a Tracklist value as a list of track strings, splitting it if it is still a CSV string."""
+    if isinstance(tracklist, str):
+        return [track.strip() for track in tracklist.split(";") if track.strip()]
+    return list(tracklist or ())
+
+def join_tracklist(tracklist):
+    """Return a Tracklist value as the "; "-separated string stored in the CSV."""
+    return tracklist if isinstance(tracklist, str) else "; ".join(tracklist)
+
+def album_csv_row(album):
+    """Return album as a CSV row in ALBUM_FIELDS order, with the Tracklist joined into one string."""
+    row = [album.get(field, "") for field in ALBUM_FIELDS]
+    row[TRACKLIST_COLUMN] = join_tracklist(row[TRACKLIST_COLUMN])
+    return row
+
+@lru_cache(maxsize=4096)
+def _is_url(url):
+    """Return whether a Cover URL is a full web URL (memoized per URL string)."""
+    return bool(URL_PATTERN.match(url))
+
+def delete_track(tracks_list):
+    """Delete the selected track of a numbered tracks Listbox and re-number the tracks after it."""
+    if len(tracks_list.curselection()) == 1:
+        indexToDelete = tracks_list.curselection()[0]
+        tracks_list.delete(indexToDelete)
+        # Re-number the remaining tracks, then replace them with one delete and one insert call.
+        renumbered = [f"{indexToDelete + 1 + j}. {track_string.split('. ', 1)[1]}"
+                      for j, track_string in enumerate(tracks_list.get(indexToDelete, tk.END))
+                      if '. ' in track_string]
+        tracks_list.delete(indexToDelete, tk.END)
+        tracks_list.insert(tk.END, *renumbered)
+
+# ---------------------------------------------------------------------------
+# Cover download helpers; these run on the cover thread pool and never touch Tk.
+# ---------------------------------------------------------------------------
+# Each cover download thread keeps its own keep-alive connections, keyed by (scheme, host).
+_http_local = threading.local()
+
+def fetch_url(url):
+    """Download url, reusing the calling thread's open connection to the same host when possible."""
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https"):
+        return urlopen(Request(url, headers={"User-Agent": "Mozilla/5.0"})).read()
+
+    connections = _http_local.__dict__.setdefault("connections", {})
+    key = (parts.scheme, parts.netloc)
+    connection = connections.get(key)
+    if connection is None:
+        connectionClass = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        connection = connections[key] = connectionClass(parts.netloc, timeout=30)
+    path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+    try:
+        connection.request("GET", path, headers={"User-Agent": "Mozilla/5.0"})
+        response = connection.getresponse()
+        data = response.read()  # Read the whole body so the connection can be reused.
+        if response.status == 200:
+            return data
+    except (http.client.HTTPException, OSError):
+        # The server may have closed the idle connection; open a fresh one next time.
+        connection.close()
+        del connections[key]
+    # Let urlopen handle redirects, errors and retries after a dropped connection.
+    return urlopen(Request(url, headers={"User-Agent": "Mozilla/5.0"})).read()
+
+def load_remote_cover(albumURL):
+    """Return the cover thumbnail for albumURL, downloading and shrinking it only if it is not cached on disk."""
+    cachePath = os.path.join(COVER_CACHE_DIR, hashlib.blake2b(albumURL.encode(), digest_size=16).hexdigest() + ".png")
+    if os.path.exists(cachePath):
+        image_obj = Image.open(cachePath)  # Already a thumbnail when it was cached.
+        image_obj.load()  # Decode here rather than on the Tk thread.
+        return image_obj
+
+    albumCoverData = fetch_url(albumURL)
+    image_obj = Image.open(io.BytesIO(albumCoverData))
+    image_obj.thumbnail((150,150), Image.BILINEAR)  # Shrink in place to fit 150x150.
+    try:
+        # Write to a temporary name first so other threads never read a half-written file.
+        os.makedirs(COVER_CACHE_DIR, exist_ok=True)
+        tempPath = f"{cachePath}.{threading.get_ident()}.tmp"
+        image_obj.save(tempPath, "PNG")
+        os.replace(tempPath, cachePath)
+    except OSError as e:
+        print(f"Could not cache album cover for {albumURL}: {e}")  # The cover is still shown.
+    return image_obj
+
+class FrameRegistry(dict):
+    """The app's page frames by class name; each frame is only created the first time it is looked up."""
+    def __init__(self, container, controller, frame_classes):
+        super().__init__()
+        self.container = container
+        self.controller = controller
+        self.frame_classes = {F.__name__: F for F in frame_classes}
+    
+    def __missing__(self, frame_name):
+        frame = self[frame_name] = self.frame_classes[frame_name](parent=self.container, controller=self.controller)
+        frame.anchor("n")  # Anchor content to the top.
+        frame.grid(row=0, column=0, sticky="nsew", pady=35)  # Place frame in grid.
+        frame.lower()  # A new frame stays behind the one on screen until show_frame raises it.
+        return frame
+
 # ---------------------------------------------------------------------------
 # Main Application Class: AlbumCatalogApp
 # ---------------------------------------------------------------------------
@@ -110,8 +314,8 @@ class AlbumCatalogApp(tk.Tk):
             image = Image.new("RGB", (1080, 1080), color=(200, 200, 200))
         # Crop the image to focus on the desired area.
         image = image.crop((0, int(1080 * 0.25), 1080, int(1080 * 0.75)))
-        # Resize the image using a high-quality resampling algorithm.
-        image = image.resize((125, 75), Image.LANCZOS)
+        # Shrink the decorative logo with a cheap box reduction followed by a bilinear resize.
+        image = image.resize((125, 75), Image.BILINEAR, reducing_gap=2.0)
         self.image = ImageTk.PhotoImage(image)  # Convert image for use with Tkinter.
         try:
             # Attempt to set the window icon.
@@ -161,36 +365,87 @@ class AlbumCatalogApp(tk.Tk):
         self.users = self.load_users()  # Load users from the JSON file.
         self.current_user = None  # Initialize the current user as None.
         self.search_results = None  # Placeholder for search results.
-        self.albums = self.load_albums_from_csv()  # Load album data from the CSV file.
+        # Load album data from the CSV file (and build its search index) on a background thread while
+        # the window is built; the albums property waits for it if the catalog is needed before it finishes.
+        self.albums = []
+        # Work that must not block the Tk thread (the album load, password checks) runs on this pool.
+        self.background_executor = ThreadPoolExecutor(max_workers=2)
+        self._albums_future = self.background_executor.submit(self.load_catalog)
+        # Cover downloads, shared with the catalog frame. Once the albums are loaded, the first covers are
+        # downloaded into the disk cache while the user logs in.
+        self.cover_executor = ThreadPoolExecutor(max_workers=COVER_WORKERS)
+        self.cover_prefetches = {}
+        self.when_albums_loaded(lambda albums: self.prefetch_covers(albums[:COVER_PREFETCH_COUNT]))
         
         # Create a container frame for multiple pages.
         container = ttk.Frame(self)
         container.pack(side="top", fill="both", expand=True)
         container.grid_rowconfigure(0, weight=1)  # Allow row expansion.
         container.grid_columnconfigure(0, weight=1)  # Allow column expansion.
-        self.frames = {}  # Dictionary to hold frames by name.
-        for F in (LoginFrame, SignupFrame, CatalogFrame):
-            frame = F(parent=container, controller=self)  # Instantiate each frame.
-            self.frames[F.__name__] = frame  # Store frame using its class name as key.
-            frame.anchor("n")  # Anchor content to the top.
-            frame.grid(row=0, column=0, sticky="nsew", pady=35)  # Place frame in grid.
-                
+        # Frames by name; each is built the first time it is shown.
+        self.frames = FrameRegistry(container, self, (LoginFrame, SignupFrame, CatalogFrame))
         self.show_frame("LoginFrame")  # Display the login frame initially.
         
         # Bind global mouse wheel events to enable scrolling in the catalog.
         self.bind_all("<MouseWheel>", self.on_global_mousewheel)
         self.bind_all("<Button-4>", self.on_global_mousewheel)  # For Linux scroll up.
         self.bind_all("<Button-5>", self.on_global_mousewheel)  # For Linux scroll down.
+        # Write any batched changes before the window closes.
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+    
+    def call_when_done(self, future, callback):
+        """Call callback(future) on the Tk thread once future is done, polling for it from the event loop.
+        
+        Worker threads must not call into Tk, so their results are picked up here rather than in a done callback.
+        """
+        if future.done():
+            callback(future)
+        else:
+            self.after(50, self.call_when_done, future, callback)
+    
+    def when_albums_loaded(self, callback):
+        """Call callback on the Tk thread with the album list once the background load finishes.
+        
+        Nothing is called if the load failed, or if an assigned album list had already replaced the load.
+        """
+        def on_done(albumsFuture):
+            if albumsFuture.exception() is None:
+                callback(albumsFuture.result()[0])
+        if self._albums_future is not None:
+            self.call_when_done(self._albums_future, on_done)
+    
+    def prefetch_covers(self, albums):
+        """Start downloading the covers of albums that are about to be shown (at login, or just below the catalog view).
+        
+        The catalog frame takes over a prefetch for the same URL instead of downloading the cover again.
+        """
+        for album in albums:
+            albumURL = album.get("Cover URL", "").strip()
+            if albumURL.startswith(URL_SCHEMES) and albumURL not in self.cover_prefetches:
+                try:
+                    # Failures are ignored here; they are reported when the catalog loads the cover itself.
+                    self.cover_prefetches[albumURL] = self.cover_executor.submit(load_remote_cover, albumURL)
+                except RuntimeError:
+                    return  # The window has been destroyed and its thread pool shut down.
+    
+    _search_after_id = None  # Pending after() id of a debounced search, if any.
     
     def on_enter_pressed(self, event):
-        """Trigger search when Enter is pressed in the search bar."""
-        self.search()  # Call the search method.
+        """Trigger search when Enter is pressed in the search bar (repeated presses within SEARCH_DELAY_MS run one search)."""
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(SEARCH_DELAY_MS, self.run_debounced_search)
         return "break"  # Prevent insertion of a newline in the Text widget.
     
+    def run_debounced_search(self):
+        """Run the search scheduled by on_enter_pressed."""
+        self._search_after_id = None
+        self.search()  # Call the search method.
+    
     def on_global_mousewheel(self, event):
         """Forward mouse wheel events to the CatalogFrame's canvas if it is visible."""
-        catalog = self.frames["CatalogFrame"]  # Get the catalog frame.
-        if catalog.winfo_ismapped():
+        catalog = self.frames.get("CatalogFrame")  # The catalog frame, if it has been built yet.
+        if catalog is not None and catalog.winfo_ismapped():
             canvas = catalog.canvas  # Retrieve the canvas widget.
             if event.num == 4:  # Linux scroll up.
                 canvas.yview_scroll(-1, "units")
@@ -200,92 +455,296 @@ class AlbumCatalogApp(tk.Tk):
                 # Windows and Mac OS: adjust scroll based on event.delta.
                 canvas.yview_scroll(int(-1*(event.delta/120)), "units")
     
+    # Last users data read from or written to USERS_JSON, as ((path, mtime_ns, size), users).
+    _users_cache = None
+    
+    def users_file_key(self):
+        """Identify the current version of the USERS_JSON file (raises OSError if it does not exist)."""
+        stat = os.stat(USERS_JSON)
+        return (USERS_JSON, stat.st_mtime_ns, stat.st_size)
+    
     def load_users(self):
-        """Load users from the USERS_JSON file."""
-        if os.path.exists(USERS_JSON):
-            with open(USERS_JSON, "r") as f:
-                try:
-                    return json.load(f)  # Return the parsed JSON data.
-                except json.JSONDecodeError:
-                    return {}  # Return empty dict if JSON is malformed.
-        return {}  # Return empty dict if file does not exist.
+        """Load users from the USERS_JSON file, skipping the parse if the file is unchanged since the last load or save."""
+        try:
+            key = self.users_file_key()
+        except OSError:
+            return {}  # Return empty dict if file does not exist.
+        if self._users_cache is not None and self._users_cache[0] == key:
+            return self._users_cache[1]
+        with open(USERS_JSON, "r") as f:
+            try:
+                users = json.load(f)  # Parse the JSON data.
+            except json.JSONDecodeError:
+                return {}  # Return empty dict if JSON is malformed.
+        if isinstance(users, dict):
+            for user in users.values():
+                if "favourites" in user:
+                    user["favourites"] = dict.fromkeys(user["favourites"])  # See user_favourites.
+        self._users_cache = (key, users)
+        return users
+    
+    def user_favourites(self, username):
+        """Return the user's favourite album IDs, creating an empty collection if needed.
+        
+        Favourites are kept in a dict with None values: O(1) membership tests, adds and removals
+        like a set, while remembering the order albums were favourited. They are stored as a list.
+        """
+        user = self.users[username]
+        favourites = user.get("favourites")
+        if not isinstance(favourites, dict):
+            favourites = user["favourites"] = dict.fromkeys(favourites or ())
+        return favourites
     
     def save_users(self):
         """Save the current users data to the USERS_JSON file."""
-        with open(USERS_JSON, "w") as f:
-            json.dump(self.users, f, indent=4)  # Write formatted JSON data.
-    
-    def save_albums(self):
-        """Save the current albums data to the ALBUMS_CSV file."""
-        with open(ALBUMS_CSV, "w", newline="", encoding="utf-8") as csvfile:
-            writer = csv.DictWriter(csvfile, ["Ranking", "Album", "Artist Name", "Release Date",
-                                                "Genres", "Average Rating", "Number of Ratings",
-                                                "Number of Reviews", "Cover URL", "Tracklist", "Deezer_ID"])
-            writer.writeheader()  # Write the CSV header.
-            for album in self.albums:
-                writer.writerow({
-                    "Ranking": album["Ranking"],
-                    "Album": album["Album"],
-                    "Artist Name": album["Artist Name"],
-                    "Release Date": album["Release Date"],
-                    "Genres": album["Genres"],
-                    "Average Rating": album["Average Rating"],
-                    "Number of Ratings": album["Number of Ratings"],
-                    "Number of Reviews": album["Number of Reviews"],
-                    "Cover URL": album["Cover URL"],
-                    "Tracklist": album["Tracklist"],
-                    "Deezer_ID": album["Deezer_ID"]
-                })
+        # Favourites are written as plain lists of album IDs.
+        users = {username: {**user, "favourites": list(user["favourites"])} if "favourites" in user else user
+                 for username, user in self.users.items()}
+        # Write to a temporary file and swap it in, so a crash never leaves a half-written file.
+        tempPath = USERS_JSON + ".tmp"
+        # Serialize compactly in one call and hand it to the OS as a single UTF-8 write.
+        with open(tempPath, "wb", buffering=1 << 20) as f:
+            f.write(json.dumps(users, separators=(",", ":")).encode("utf-8"))
+        os.replace(tempPath, USERS_JSON)
+        self._users_cache = (self.users_file_key(), self.users)  # The file now holds exactly self.users.
     
-    def load_albums_from_csv(self):
-        """Load album data from the ALBUMS_CSV file and return as a list of dictionaries."""
-        albums = []  # Initialize list to hold album data.
-        if os.path.exists(ALBUMS_CSV):
-            with open(ALBUMS_CSV, newline="", encoding="utf-8") as csvfile:
-                reader = csv.DictReader(csvfile)
-                for row in reader:
-                    # Construct an album dictionary with stripped string values.
-                    album = {
-                        "Ranking": (row.get("Ranking") or "").strip(),
-                        "Album": (row.get("Album") or "").strip(),
-                        "Artist Name": (row.get("Artist Name") or "").strip(),
-                        "Release Date": (row.get("Release Date") or "").strip(),
-                        "Genres": (row.get("Genres") or "").strip(),
-                        "Average Rating": (row.get("Average Rating") or "").strip(),
-                        "Number of Ratings": (row.get("Number of Ratings") or "").strip(),
-                        "Number of Reviews": (row.get("Number of Reviews") or "").strip(),
-                        "Cover URL": (row.get("Cover URL") or "").strip(),
-                        "Tracklist": (row.get("Tracklist") or "").strip(),
-                        "Deezer_ID": (row.get("Deezer_ID") or "").strip()
-                    }
-                    albums.append(album)
+    # Saves are batched: changes mark the data dirty and a single flush runs SAVE_DELAY_MS after the last change.
+    _save_after_id = None  # Pending after() id of flush_pending_saves, if any.
+    _users_dirty = False
+    _albums_dirty = False  # The whole album file must be rewritten.
+    _pending_new_albums = ()  # Albums added since the last flush, which can simply be appended.
+    
+    def schedule_save(self):
+        """(Re)start the timer that flushes pending changes to disk."""
+        if self._save_after_id is not None:
+            self.after_cancel(self._save_after_id)
+        self._save_after_id = self.after(SAVE_DELAY_MS, self.flush_pending_saves)
+    
+    def mark_users_dirty(self):
+        """Record that self.users changed; it is written by the next flush."""
+        self._users_dirty = True
+        self.schedule_save()
+    
+    def mark_albums_dirty(self, new_albums=None):
+        """Record that self.albums changed; new_albums lists albums that were only appended to it."""
+        # The catalog changed; rebuild the search columns and the Deezer_ID lookup when next needed.
+        self._search_columns = None
+        self._albums_by_deezer_id = None
+        if new_albums is not None and not self._albums_dirty:
+            self._pending_new_albums = [*self._pending_new_albums, *new_albums]
         else:
+            self._albums_dirty = True  # A full rewrite also covers any pending appends.
+            self._pending_new_albums = ()
+        self.schedule_save()
+    
+    def flush_pending_saves(self):
+        """Write any pending user and album changes to disk now."""
+        if self._save_after_id is not None:
+            self.after_cancel(self._save_after_id)
+            self._save_after_id = None
+        if self._users_dirty:
+            self._users_dirty = False
+            self.save_users()
+        if self._albums_dirty:
+            self._albums_dirty = False
+            self.save_albums()
+        elif self._pending_new_albums:
+            self.save_albums(new_albums=self._pending_new_albums)
+        self._pending_new_albums = ()
+    
+    def on_close(self):
+        """Flush pending saves before the main window closes."""
+        self.flush_pending_saves()
+        self.destroy()
+    
+    def destroy(self):
+        """Let the background threads finish their current task and exit once the window is gone."""
+        self.background_executor.shutdown(wait=False)
+        self.cover_executor.shutdown(wait=False, cancel_futures=True)  # Queued cover loads are no longer needed.
+        super().destroy()
+    
+    _albums_future = None  # Pending background load of the album CSV, if any.
+    
+    @property
+    def albums(self):
+        """The album catalog as a list of album dictionaries."""
+        if self._albums_future is not None:
+            albums, search_columns = self._albums_future.result()  # Blocks only if the background load is still running.
+            self.albums = albums
+            self._search_columns = search_columns
+        return self._albums
+    
+    @albums.setter
+    def albums(self, albums):
+        self._albums = albums
+        self._albums_future = None  # An assigned list replaces any pending background load.
+        self._search_columns = None  # Rebuilt from the new list on the next search.
+        self._albums_by_deezer_id = None  # Rebuilt from the new list when favourites are next shown.
+    
+    def load_catalog(self):
+        """Load the album CSV and build its search index; run on the loader thread at startup."""
+        albums = self.load_albums_from_csv()
+        return albums, self.build_search_columns(albums)
+    
+    def build_search_columns(self, albums):
+        """Build the search index: each text field's lowercased values joined into one string, plus release-date parts."""
+        columns = {}
+        for field in ("Album", "Artist Name", "Genres"):
+            # One newline-separated string per field lets str.find scan every album in C;
+            # starts[i] is the offset of album i in that string (starts[-1] is one past the end).
+            values = [(album.get(field) or "").lower().replace("\n", " ") for album in albums]
+            starts = list(accumulate((len(value) + 1 for value in values), initial=0))
+            # Trigram index: every 3-character substring mapped to the albums containing it.
+            trigrams = {}
+            for index, value in enumerate(values):
+                for trigram in {value[i:i + 3] for i in range(len(value) - 2)}:
+                    trigrams.setdefault(trigram, []).append(index)
+            columns[field] = ("\n".join(values), starts, trigrams)
+        # Release dates are matched part by part (year, month, day), so map each part to its albums.
+        date_parts = {}
+        for index, album in enumerate(albums):
+            for part in set((album.get("Release Date") or "").split("-")):
+                date_parts.setdefault(part, []).append(index)
+        columns["Release Date"] = date_parts
+        return columns
+    
+    def album_csv_accepts_appends(self):
+        """Return True if ALBUMS_CSV has exactly the ALBUM_FIELDS columns and ends with a complete row."""
+        try:
+            with open(ALBUMS_CSV, "rb") as csvfile:
+                header = next(csv.reader([csvfile.readline().decode("utf-8")]), [])
+                if [name.strip() for name in header] != list(ALBUM_FIELDS):
+                    return False
+                csvfile.seek(-1, os.SEEK_END)
+                return csvfile.read(1) == b"\n"
+        except (OSError, UnicodeDecodeError):
+            return False
+    
+    def save_albums(self, new_albums=None):
+        """Save the current albums data to the ALBUMS_CSV file.
+        
+        new_albums may list albums just appended to self.albums; if the file's columns already match,
+        only those rows are appended instead of rewriting the whole file.
+        """
+        appending = new_albums is not None and self.album_csv_accepts_appends()
+        # A full rewrite goes to a temporary file that is swapped in once complete.
+        path = ALBUMS_CSV if appending else ALBUMS_CSV + ".tmp"
+        # A 1 MiB buffer batches the rows into a few large writes.
+        with open(path, "a" if appending else "w", newline="", encoding="utf-8", buffering=1 << 20) as csvfile:
+            # Plain rows in ALBUM_FIELDS order; any key outside ALBUM_FIELDS is left out.
+            writer = csv.writer(csvfile)
+            if not appending:
+                writer.writerow(ALBUM_FIELDS)  # Write the CSV header.
+            writer.writerows(map(album_csv_row, new_albums if appending else self.albums))
+        if not appending:
+            os.replace(path, ALBUMS_CSV)
+    
+    def load_albums_from_csv(self):
+        """Load album data from the ALBUMS_CSV file and return as a list of dictionaries.
+        
+        The parsed list is cached in ALBUMS_PICKLE together with the CSV's path, modification time
+        and size, and loaded from there instead while the CSV is unchanged.
+        """
+        try:
+            stat = os.stat(ALBUMS_CSV)
+        except OSError:
             print("The file does not exist.")  # Log if the CSV file is missing.
+            return []
+        csvKey = (os.path.abspath(ALBUMS_CSV), stat.st_mtime_ns, stat.st_size)
+        try:
+            with open(ALBUMS_PICKLE, "rb") as f:
+                pickleKey, albums = pickle.load(f)
+            if pickleKey == csvKey:
+                return albums
+        except Exception:
+            pass  # No usable cache; parse the CSV.
+        albums = self.parse_albums_csv()
+        try:
+            # Write to a temporary file and swap it in, so a reader never sees a partial cache.
+            with open(ALBUMS_PICKLE + ".tmp", "wb") as f:
+                pickle.dump((csvKey, albums), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(ALBUMS_PICKLE + ".tmp", ALBUMS_PICKLE)
+        except OSError as e:
+            print(f"Could not cache parsed albums: {e}")  # The albums were still loaded.
         return albums
     
+    def parse_albums_csv(self):
+        """Parse the ALBUMS_CSV file into a list of album dictionaries."""
+        if not os.path.exists(ALBUMS_CSV):
+            print("The file does not exist.")  # Log if the CSV file is missing.
+            return []
+        return list(self.iter_albums_csv())
+    
+    def iter_albums_csv(self):
+        """Yield the albums in the ALBUMS_CSV file one at a time, reading the file row by row."""
+        # A 1 MiB buffer reads the file in a few large chunks, matching save_albums.
+        with open(ALBUMS_CSV, newline="", encoding="utf-8", buffering=1 << 20) as csvfile:
+            # Use the plain csv.reader (rows come straight from the C tokenizer as lists)
+            # and look fields up by column position instead of building a DictReader dict per row.
+            reader = csv.reader(csvfile)
+            header = [name.strip() for name in next(reader, [])]
+            # Pair each album field with its column position; missing columns read as "".
+            positions = [(field, header.index(field) if field in header else None) for field in ALBUM_FIELDS]
+            padding = [""] * len(header)
+            inFieldOrder = header == list(ALBUM_FIELDS)  # The usual case: columns can be zipped with the fields directly.
+            for row in reader:
+                if not row:
+                    continue  # Skip blank lines, as DictReader does.
+                if len(row) < len(header):
+                    row += padding[len(row):]  # Short rows are missing trailing values.
+                # Construct an album dictionary with stripped string values.
+                if inFieldOrder:
+                    album = dict(zip(ALBUM_FIELDS, map(str.strip, row)))
+                else:
+                    album = {field: row[pos].strip() if pos is not None else "" for field, pos in positions}
+                for field in INTERNED_ALBUM_FIELDS:
+                    album[field] = sys.intern(album[field])
+                album["Tracklist"] = split_tracklist(album["Tracklist"])
+                yield album
+    
     def load_search_query(self, search_query):
         """Filter albums based on the search query and selected filter criteria."""
         self.search_results = []  # Reset search results.
         search_query = search_query.lower().strip() if search_query else None  # Normalize the query.
         selected_filter = self.search_filter.get()  # Get the currently selected filter.
+        if search_query is None:
+            self.search_results = list(self.albums)  # If no query is provided, include all albums.
+            return
+        field = SEARCH_FILTER_FIELDS.get(selected_filter)
+        if field is None:
+            return  # Unknown filter: nothing matches.
+        
+        if self._search_columns is None:
+            self._search_columns = self.build_search_columns(self.albums)
+        column = self._search_columns[field]
+        albums = self.albums
+        if field == "Release Date":
+            self.search_results = [albums[i] for i in column.get(search_query, ())]
+            return
+        if not albums or "\n" in search_query:
+            return  # Field values are single-line, so a multi-line query cannot match.
+        
+        text, starts, trigrams = column
+        if len(search_query) >= 3:
+            # Only albums containing every trigram of the query can match; check just those.
+            postings = sorted((trigrams.get(search_query[i:i + 3], ()) for i in range(len(search_query) - 2)), key=len)
+            candidates = set(postings[0]).intersection(*postings[1:])
+            self.search_results = [albums[index] for index in sorted(candidates)
+                                   if search_query in text[starts[index]:starts[index + 1] - 1]]
+            return
         
-        def matches_filter(album):
-            """Determine if the album matches the search query based on the selected filter."""
-            if search_query is None:
-                return True  # If no query is provided, include all albums.
-            if selected_filter == "Album Name":
-                return search_query in album.get("Album", "").lower()
-            if selected_filter == "Artist Name":
-                return search_query in album.get("Artist Name", "").lower()
-            if selected_filter == "Genres":
-                return search_query in album.get("Genres", "").lower()
-            if selected_filter == "Release Date":
-                return search_query in album.get("Release Date", "").split("-")
-            return False
-        
-        # Filter the albums list using the matches_filter function.
-        self.search_results = list(filter(matches_filter, self.albums.copy()))
+        # Short queries: find each hit in the joined column, record its album, then resume from the next album.
+        position = text.find(search_query)
+        while position != -1:
+            index = bisect_right(starts, position) - 1
+            self.search_results.append(albums[index])
+            position = text.find(search_query, starts[index + 1])
     
+    @property
+    def is_logged_in(self):
+        """The current login state, read straight from the module global without logging."""
+        return is_logged_in
+
     def show_frame(self, frame_name):
         """Bring the specified frame to the front and manage search widget visibility."""
         frame = self.frames[frame_name]  # Retrieve the frame by its name.
@@ -318,12 +777,13 @@ class AlbumCatalogApp(tk.Tk):
         if not "favourites" in self.users[current_user]:
             messagebox.showerror("No Results", "No favourites yet.")
         else:
-            # Iterate over each favourite album ID and add the matching album to search_results.
-            for id in self.users[current_user]["favourites"]:
+            # Look up each favourite album ID and add the matching album to search_results.
+            if self._albums_by_deezer_id is None:
+                self._albums_by_deezer_id = {}
                 for album in self.albums:
-                    if album["Deezer_ID"] == id:
-                        self.search_results.append(album)
-                        break
+                    self._albums_by_deezer_id.setdefault(album["Deezer_ID"], album)  # The first album with an ID wins.
+            self.search_results = [self._albums_by_deezer_id[id] for id in self.user_favourites(current_user)
+                                   if id in self._albums_by_deezer_id]
                 
         frame = self.frames["CatalogFrame"]
         frame.refresh_album_list()  # Refresh the catalog to show favourites.
@@ -373,13 +833,19 @@ class LoginFrame(tk.Frame):
         username = self.username_entry.get()  # Retrieve username.
         password = self.password_entry.get()  # Retrieve password.
         users = self.controller.users  # Get user data from the controller.
-        if username in users and users[username]["password"] == password:
+        # Checked on the Tk thread, unlike in edit_account: logging in finishes synchronously, and the
+        # one scrypt run (tens of ms) happens while the user is waiting for the login result anyway.
+        if username in users and verify_password(users[username]["password"], password):
+            if not is_password_hash(users[username]["password"]):
+                # Replace a legacy plaintext password with its hash.
+                users[username]["password"] = hash_password(password)
+                self.controller.mark_users_dirty()
             self.controller.current_user = username  # Set the current user.
             # Update global login state variables.
             global current_user, is_logged_in
             current_user = username
             is_logged_in = True
-            print(f"DEBUG: User '{username}' logged in successfully. is_logged_in = {is_logged_in}")
+            logger.debug("User '%s' logged in successfully. is_logged_in = %s", username, is_logged_in)
             messagebox.showinfo("Login", "Login successful!")  # Inform the user of success.
             # Display the search and favourites buttons now that the user is logged in.
             self.controller.favourites_button.pack(side="right", padx=10)
@@ -485,12 +951,12 @@ class SignupFrame(tk.Frame):
             messagebox.showerror("Error", "Passwords do not match.")
             return
         # Validate the email format using a regular expression.
-        if re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', email) is None:
+        if EMAIL_PATTERN.match(email) is None:
             messagebox.showerror("Error", "Email is invalid.")
             return
         # Create the new user account.
-        self.controller.users[username] = {"email": email, "password": password}
-        self.controller.save_users()  # Save the new user data.
+        self.controller.users[username] = {"email": email, "password": hash_password(password)}
+        self.controller.mark_users_dirty()  # Save the new user data.
         messagebox.showinfo("Sign Up", "Account created successfully!")
         self.controller.show_frame("LoginFrame")  # Return to the login frame.
         # Clear the input fields.
@@ -507,10 +973,19 @@ class CatalogFrame(tk.Frame):
         super().__init__(parent, bg=PRIMARY_BACKGROUND_COLOUR)
         self.controller = controller  # Reference to the main application controller.
         
-        # Initialize a cache for album cover images to avoid reloading.
-        self.album_cover_cache = {}
-        # Create a thread pool executor to manage concurrent image loading.
-        self.executor = ThreadPoolExecutor(max_workers=4)
+        # Initialize a cache for album cover images to avoid reloading, least recently used first.
+        self.album_cover_cache = OrderedDict()
+        # The default cover is shown until an album's own cover has loaded; it is never evicted.
+        default_img = Image.open("./Code/Eric.png").resize((150,150), Image.BICUBIC)
+        self.album_cover_cache["default"] = ImageTk.PhotoImage(default_img)
+        # Covers load on the application's thread pool, which may already be prefetching them.
+        self.executor = controller.cover_executor
+        # Covers decoded by the workers are queued here and installed on the Tk thread.
+        self.cover_queue = queue.Queue()
+        self.cover_poll_id = None  # Pending after() id of process_loaded_covers, if any.
+        self.refresh_generation = 0  # Bumped on every refresh so late covers for old rows are dropped.
+        self.pending_covers = 0  # Covers of the current refresh not yet installed.
+        self.refresh_album_threads = []  # Futures of the cover loads of the current refresh.
         
         # Configure grid layout for dynamic resizing.
         self.grid_rowconfigure(1, weight=1)
@@ -526,7 +1001,9 @@ class CatalogFrame(tk.Frame):
         # Create a vertical scrollbar for the canvas.
         scrollbar = tk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
         scrollbar.grid(row=1, column=1, sticky="ns")
-        self.canvas.configure(yscrollcommand=scrollbar.set)
+        self.scrollbar = scrollbar
+        # Tk calls this whenever the visible part of the canvas changes (scrolling, resizing, new list height).
+        self.canvas.configure(yscrollcommand=self.on_canvas_scroll)
         
         # Create an inner frame (list_frame) that will contain album items.
         self.list_frame = tk.Frame(self.canvas, bg=NAV_BAR_SHADOW_1_COLOUR)
@@ -541,8 +1018,19 @@ class CatalogFrame(tk.Frame):
         # Global mouse wheel bindings are managed by the main application.
         
         self.selected_album = None  # Tracks the currently selected album.
-        self.album_items = []  # List to store references to album item widgets.
+        self.displayed_albums = []  # Albums in the list currently shown (catalog, search results or favourites).
+        self.album_items = []  # Album item widget shown for each displayed album (None while not rendered).
         self.album_cover_images = []  # List to store PhotoImage references for album covers.
+        # Rendered album items by list index, and created items not currently in use.
+        # Each item is the widget tuple returned by create_album_item.
+        self.rendered_items = {}
+        self.free_items = []
+        self.album_index_by_item = {}  # List index of each rendered album item widget.
+        self.cover_futures = {}  # Cover load submitted for each list index in the current refresh.
+        self.prefetch_futures = controller.cover_prefetches  # Prefetched cover downloads by URL, until an album item takes them over.
+        # Dialog windows by name, kept hidden between uses, and the widgets of the pooled album forms.
+        self.dialog_windows = {}
+        self.album_forms = {}
         
         # Create a frame for control buttons.
         buttonFrame = tk.Frame(self, bg=PRIMARY_BACKGROUND_COLOUR)
@@ -569,58 +1057,42 @@ class CatalogFrame(tk.Frame):
         self.refresh_button = ttk.Button(buttonFrame, text="Refresh", command=self.controller.refresh_catalog)
         self.refresh_button.grid(row=0, column=8, padx=5, pady=10)
         self.refresh_button.grid_remove()  # Hide the refresh button initially.
-
-    
-    def thread_function_refresh_albums(self, index, album, currentRow):
-        """Thread function to load and display a single album item."""
-        albumName = album.get("Album")  # Retrieve album name.
-        artistName = album.get("Artist Name")  # Retrieve artist name.
-        genres = album.get("Genres")  # Retrieve album genres.
-        releaseDate = album.get("Release Date")  # Retrieve release date.
         
+    
+    def destroy(self):
+        """Stop polling for covers before destroying the frame."""
+        if self.cover_poll_id is not None:
+            self.after_cancel(self.cover_poll_id)
+            self.cover_poll_id = None
+        super().destroy()
+    
+    def prefetch_covers(self, albums):
+        """Prefetch the covers of albums that are not already in memory (see AlbumCatalogApp.prefetch_covers)."""
+        self.controller.prefetch_covers([album for album in albums
+                                         if album.get("Cover URL", "").strip() not in self.album_cover_cache])
+    
+    def thread_function_refresh_albums(self, albumURL):
+        """Thread function to fetch and decode one album cover, returning a PIL thumbnail (or None if not needed).
+        
+        Runs on the thread pool, so it must not create or touch any Tk widgets or PhotoImages.
+        """
+        if not albumURL or albumURL in self.album_cover_cache:
+            return None  # The album item already shows the default or a loaded cover.
+        if albumURL.startswith(URL_SCHEMES):
+            return load_remote_cover(albumURL)
+        # Otherwise, treat albumURL as a local file path.
+        image_obj = Image.open(albumURL)
+        image_obj.thumbnail((150,150), Image.BILINEAR)  # Shrink in place to fit 150x150.
+        return image_obj
+    
+    def create_album_item(self):
+        """Create the widgets for one album item and add them to the pool of reusable items."""
         # Create a frame to represent an album item.
         albumItem = tk.Frame(self.list_frame, bg=NAV_BAR_SHADOW_2_COLOUR)
-        albumItem.grid(row=currentRow, column=0, padx=15, pady=15)
         albumItem.grid_propagate(False)  # Prevent automatic resizing.
         
-        # Load the album cover image with caching.
-        albumURL = album.get("Cover URL", "").strip()
-        if albumURL:
-            if albumURL in self.album_cover_cache:
-                albumCover = self.album_cover_cache[albumURL]  # Use cached image.
-            else:
-                try:
-                    if URL_PATTERN.match(albumURL):
-                        # Fetch image via HTTP if albumURL is a valid URL.
-                        req = Request(albumURL, headers={"User-Agent": "Mozilla/5.0"})
-                        response = urlopen(req)
-                        albumCoverData = response.read()
-                        image_obj = Image.open(io.BytesIO(albumCoverData))
-                    else:
-                        # Otherwise, treat albumURL as a local file path.
-                        image_obj = Image.open(albumURL)
-                    image_obj = image_obj.resize((150,150), Image.LANCZOS)  # Resize the image.
-                    albumCover = ImageTk.PhotoImage(image_obj)
-                    self.album_cover_cache[albumURL] = albumCover  # Cache the image.
-                except Exception as e:
-                    print(f"Failed to load album cover for {albumURL}: {e}")  # Log error.
-                    albumCover = self.album_cover_cache.get("default")
-                    if albumCover is None:
-                        default_img = Image.open("./Code/Eric.png")
-                        default_img = default_img.resize((150,150), Image.LANCZOS)
-                        albumCover = ImageTk.PhotoImage(default_img)
-                        self.album_cover_cache["default"] = albumCover  # Cache the default image.
-        else:
-            # Use default image if no album URL is provided.
-            albumCover = self.album_cover_cache.get("default")
-            if albumCover is None:
-                default_img = Image.open("./Code/Eric.png")
-                default_img = default_img.resize((150,150), Image.LANCZOS)
-                albumCover = ImageTk.PhotoImage(default_img)
-                self.album_cover_cache["default"] = albumCover
-        
         # Create a label widget to display the album cover image.
-        coverLabel = tk.Label(albumItem, image=albumCover, bg="white")
+        coverLabel = tk.Label(albumItem, bg="white")
         coverLabel.pack(side="left")
         
         # Create a frame to hold album details (labels).
@@ -629,97 +1101,249 @@ class CatalogFrame(tk.Frame):
         labelFrame.pack_propagate(False)
         
         # Create and pack labels for album name, artist, genres, and release date.
-        albumNameLabel = tk.Label(labelFrame, name="albumNameLabel", text=albumName, bg=NAV_BAR_SHADOW_2_COLOUR,
+        albumNameLabel = tk.Label(labelFrame, name="albumNameLabel", bg=NAV_BAR_SHADOW_2_COLOUR,
                                    fg="white", font=("Helvetica",12,"bold"), anchor="w")
         albumNameLabel.pack(fill="x")
-        artistNameLabel = tk.Label(labelFrame, name="artistNameLabel", text=f"By: {artistName}", bg=NAV_BAR_SHADOW_2_COLOUR,
+        artistNameLabel = tk.Label(labelFrame, name="artistNameLabel", bg=NAV_BAR_SHADOW_2_COLOUR,
                                     fg="white", font=("Helvetica",10,"bold"), anchor="w")
         artistNameLabel.pack(fill="x")
-        genresLabel = tk.Label(labelFrame, name="genresLabel", text=f"Genres: {genres}", bg=NAV_BAR_SHADOW_2_COLOUR,
+        genresLabel = tk.Label(labelFrame, name="genresLabel", bg=NAV_BAR_SHADOW_2_COLOUR,
                                 fg="white", font=("Helvetica",10,"bold"), anchor="w")
         genresLabel.pack(fill="x")
-        releaseDateLabel = tk.Label(labelFrame, name="releaseDateLabel", text=f"Released: {releaseDate}", bg=NAV_BAR_SHADOW_2_COLOUR,
+        releaseDateLabel = tk.Label(labelFrame, name="releaseDateLabel", bg=NAV_BAR_SHADOW_2_COLOUR,
                                     fg="white", font=("Helvetica",10,"bold"), anchor="w")
         releaseDateLabel.pack(fill="x")
         
+        # Bind a click event to each widget in the album item to enable selection.
+        for widget in [albumItem, labelFrame, albumNameLabel, artistNameLabel, genresLabel, releaseDateLabel, coverLabel]:
+            widget.bind("<Button-1>", lambda event, item=albumItem: self.select_album(event, item))
+        
+        return (albumItem, coverLabel, labelFrame, albumNameLabel, artistNameLabel, genresLabel, releaseDateLabel)
+    
+    def show_album_item(self, index, album, no_threading=False):
+        """Render album at list position index in a free album item (creating one if needed), and load its cover."""
+        pooledItem = self.free_items.pop() if self.free_items else self.create_album_item()
+        albumItem, coverLabel, labelFrame, albumNameLabel, artistNameLabel, genresLabel, releaseDateLabel = pooledItem
+        
+        # Use the cached cover image if there is one; set_album_cover swaps it in later otherwise.
+        albumURL = album.get("Cover URL", "").strip()
+        albumCover = self.album_cover_cache.get(albumURL) if albumURL else None
+        if albumCover is None:
+            albumCover = self.album_cover_cache["default"]
+        else:
+            self.album_cover_cache.move_to_end(albumURL)  # Mark the cover as recently used.
+        coverLabel.config(image=albumCover)
+        
+        # Fill in the album details; a reused item may still carry the previous selection colour.
+        albumNameLabel.config(text=album.get("Album"), bg=NAV_BAR_SHADOW_2_COLOUR)
+        artistNameLabel.config(text=f"By: {album.get('Artist Name')}", bg=NAV_BAR_SHADOW_2_COLOUR)
+        genresLabel.config(text=f"Genres: {album.get('Genres')}", bg=NAV_BAR_SHADOW_2_COLOUR)
+        releaseDateLabel.config(text=f"Released: {album.get('Release Date')}", bg=NAV_BAR_SHADOW_2_COLOUR)
+        labelFrame.config(bg=NAV_BAR_SHADOW_2_COLOUR)
+        albumItem.config(bg=NAV_BAR_SHADOW_2_COLOUR)
+        albumItem.place(relx=0.5, y=index * ALBUM_ITEM_HEIGHT + 15, anchor="n")
+        
         # Store the album item and its cover image in corresponding lists.
+        self.rendered_items[index] = pooledItem
         self.album_items[index] = albumItem
+        self.album_index_by_item[albumItem] = index
         self.album_cover_images[index] = albumCover
+        # Only covers that are not already in memory go to the thread pool; the rest were set above.
+        if albumURL and albumURL not in self.album_cover_cache and index not in self.cover_futures:
+            self.load_album_cover(index, albumURL, no_threading)
+    
+    def load_album_cover(self, index, albumURL, no_threading=False):
+        """Load the cover for the album at index on the thread pool (or right away if threading is disabled)."""
+        if no_threading:
+            try:
+                image_obj = self.thread_function_refresh_albums(albumURL)
+            except Exception as e:
+                print(f"Failed to load album cover for {albumURL}: {e}")  # Log error; keep the default cover.
+                return
+            if image_obj is not None:
+                self.set_album_cover(index, albumURL, image_obj)
+            return
         
-        # Bind a click event to each widget in the album item to enable selection.
-        for widget in [albumItem, labelFrame, albumNameLabel, artistNameLabel, genresLabel, releaseDateLabel, coverLabel]:
-            widget.bind("<Button-1>", lambda event, item=albumItem: self.select_album(event, item))
+        # Submit the cover load to the thread pool (or take over its prefetch); the result is queued for process_loaded_covers.
+        generation = self.refresh_generation
+        future = self.prefetch_futures.pop(albumURL, None)
+        if future is None or future.cancelled():
+            future = self.executor.submit(self.thread_function_refresh_albums, albumURL)
+        future.add_done_callback(lambda future: self.cover_queue.put((generation, index, albumURL, future)))
+        self.cover_futures[index] = future
+        self.refresh_album_threads.append(future)
+        self.pending_covers += 1
+        if self.cover_poll_id is None:
+            self.cover_poll_id = self.after(50, self.process_loaded_covers)
+    
+    def set_album_cover(self, index, albumURL, image_obj):
+        """Cache a newly loaded cover image and show it on the album item at index if that is rendered."""
+        albumCover = self.album_cover_cache.get(albumURL)
+        if albumCover is None:
+            albumCover = ImageTk.PhotoImage(image_obj)
+            self.album_cover_cache[albumURL] = albumCover  # Cache the image.
+            if len(self.album_cover_cache) > COVER_MEMORY_CACHE_SIZE:
+                # Drop the least recently used cover, but never the default one. Rendered items keep theirs in album_cover_images.
+                del self.album_cover_cache[next(url for url in self.album_cover_cache if url != "default")]
+        # The list may have shifted since the load started; only show the cover on an item that still wants it.
+        if index in self.rendered_items and self.displayed_albums[index].get("Cover URL", "").strip() == albumURL:
+            self.rendered_items[index][1].config(image=albumCover)  # The item's cover label.
+            self.album_cover_images[index] = albumCover
+    
+    def process_loaded_covers(self):
+        """Install covers finished by the thread pool; polled from the Tk event loop while loads are pending."""
+        while True:
+            try:
+                generation, index, albumURL, future = self.cover_queue.get_nowait()
+            except queue.Empty:
+                break
+            if generation != self.refresh_generation:
+                continue  # The album item it was loaded for now shows a different album.
+            self.pending_covers -= 1
+            try:
+                image_obj = future.result()
+            except Exception as e:
+                print(f"Failed to load album cover for {albumURL}: {e}")  # Log error; keep the default cover.
+                continue
+            if image_obj is not None:
+                self.set_album_cover(index, albumURL, image_obj)
+        # Keep polling until every cover of the current refresh has been installed.
+        self.cover_poll_id = self.after(50, self.process_loaded_covers) if self.pending_covers > 0 else None
+    
+    def on_canvas_scroll(self, first, last):
+        """Update the scrollbar and render the album items that have scrolled into view."""
+        self.scrollbar.set(first, last)
+        self.render_visible_items()
+    
+    def visible_item_range(self):
+        """Return the (start, stop) list indexes of the album items in or near the visible part of the canvas."""
+        count = len(self.displayed_albums)
+        top = int(self.canvas.yview()[0] * count * ALBUM_ITEM_HEIGHT)  # Canvas y of the top of the view.
+        viewHeight = self.canvas.winfo_height()
+        if viewHeight <= 1:
+            viewHeight = 720  # Not drawn yet; assume the full window height.
+        first = top // ALBUM_ITEM_HEIGHT - ALBUM_ITEM_OVERSCAN
+        last = (top + viewHeight) // ALBUM_ITEM_HEIGHT + 1 + ALBUM_ITEM_OVERSCAN
+        return max(0, first), min(count, last)
+    
+    def render_visible_items(self, no_threading=False):
+        """Render the album items in view and free the ones that have scrolled out of it."""
+        first, last = self.visible_item_range()
+        for index in [index for index in self.rendered_items if not first <= index < last]:
+            pooledItem = self.rendered_items[index]
+            if pooledItem[0] is self.selected_album:
+                continue  # Keep the selected item (and its highlight) until the list is refreshed.
+            del self.rendered_items[index]
+            del self.album_index_by_item[pooledItem[0]]
+            pooledItem[0].place_forget()
+            self.album_items[index] = None
+            self.album_cover_images[index] = None
+            self.free_items.append(pooledItem)
+        for index in range(first, last):
+            if index not in self.rendered_items:
+                self.show_album_item(index, self.displayed_albums[index], no_threading)
+        if not no_threading:
+            self.prefetch_covers(self.displayed_albums[last:last + COVER_PREFETCH_AHEAD])
+    
+    def get_selected_album(self):
+        """Return the album shown by the selected item, from the list that is currently displayed."""
+        return self.displayed_albums[self.album_index_by_item[self.selected_album]]
     
     def refresh_album_list(self, no_threading = False):
         """Clear and repopulate the album list display based on current data or search results."""
-        # Destroy any existing album item widgets.
-        for existingAlbumItem in self.album_items:
-            if existingAlbumItem is not None:
-                existingAlbumItem.destroy()
-        self.album_items = []  # Reset the list of album items.
+        # Drop cover loads that are still queued for the previous list.
+        for future in self.refresh_album_threads:
+            future.cancel()
+        self.refresh_generation += 1
+        # List to hold future objects if threading is used.
+        self.refresh_album_threads = []
+        self.cover_futures = {}
+        self.pending_covers = 0
+        # Finished prefetches have filled the disk cache; only keep the ones still downloading.
+        for albumURL in [albumURL for albumURL, future in self.prefetch_futures.items() if future.done()]:
+            del self.prefetch_futures[albumURL]
         if self.controller.search_results is not None:
             album_arr_to_use = self.controller.search_results  # Use filtered search results.
         else:
             album_arr_to_use = self.controller.albums  # Use the full album catalog.
-        # Initialize album_items with placeholders.
-        for _ in range(len(album_arr_to_use)):
-            self.album_items.append(None)
+        self.displayed_albums = album_arr_to_use
+        # Every rendered album item becomes free for reuse by the new list.
+        self.free_items.extend(self.rendered_items.values())
+        self.rendered_items = {}
+        self.album_index_by_item = {}
+        self.album_items = [None] * len(album_arr_to_use)  # Initialize album_items with placeholders.
         self.album_cover_images = [None] * len(album_arr_to_use)  # Initialize cover image list.
         self.selected_album = None  # Reset the selected album.
-        currentRow = 0  # Start at the first grid row.
-        # List to hold future objects if threading is used.
-        self.refresh_album_threads = []
-        for index, album in enumerate(album_arr_to_use):
-            if no_threading:
-                # If threading is disabled, load album item synchronously.
-                self.thread_function_refresh_albums(index, album, currentRow)
-                currentRow += 1
-                continue
-            
-            # Submit the album refresh function to the thread pool.
-            future = self.executor.submit(self.thread_function_refresh_albums, index, album, currentRow)
-            self.refresh_album_threads.append(future)
-            currentRow += 1
-        # No explicit wait is required for thread futures.
+        # Size the list frame for every album so the scrollbar covers the whole list, then
+        # create widgets only for the album items in view; the rest are rendered on scroll.
+        self.list_frame.configure(height=len(album_arr_to_use) * ALBUM_ITEM_HEIGHT)
+        self.canvas.yview_moveto(0)  # A new list starts at the top.
+        self.render_visible_items(no_threading)
+        # Hide album items that were not reused.
+        for pooledItem in self.free_items:
+            pooledItem[0].place_forget()
+    
+    def redraw_album_rows(self, start):
+        """Update the display after the catalog changed from list position start onwards (edit, append or delete)."""
+        if self.displayed_albums is not self.controller.albums:
+            self.refresh_album_list()  # A search or favourites view may no longer match the catalog.
+            return
+        # Free the rendered items from start on; the items before it still show the right albums.
+        for index in [index for index in self.rendered_items if index >= start]:
+            pooledItem = self.rendered_items.pop(index)
+            del self.album_index_by_item[pooledItem[0]]
+            if pooledItem[0] is self.selected_album:
+                self.selected_album = None
+            self.free_items.append(pooledItem)
+        self.cover_futures = {index: future for index, future in self.cover_futures.items() if index < start}
+        count = len(self.displayed_albums)
+        self.album_items[start:] = [None] * (count - start)
+        self.album_cover_images[start:] = [None] * (count - start)
+        self.list_frame.configure(height=count * ALBUM_ITEM_HEIGHT)
+        self.render_visible_items()
+        # Hide album items that were not reused.
+        for pooledItem in self.free_items:
+            pooledItem[0].place_forget()
+    
+    def set_album_item_colour(self, albumItem, colour):
+        """Set the background of a rendered album item and its detail labels (but not its cover)."""
+        index = self.album_index_by_item.get(albumItem)
+        if index is None:
+            return  # The item has been freed; show_album_item resets its colour when it is reused.
+        pooledItem = self.rendered_items[index]
+        pooledItem[0].config(bg=colour)  # The album item frame.
+        for widget in pooledItem[2:]:  # The label frame and its labels.
+            widget.config(bg=colour)
     
     def select_album(self, event, albumItem: tk.Frame):
         """Handle album selection by updating UI to highlight the selected album."""
-        # Reset background colours for all album items.
-        for item in self.album_items:
-            if item is not None:
-                item.config(bg=NAV_BAR_SHADOW_2_COLOUR)
-                item.nametowidget("labelFrame").config(bg=NAV_BAR_SHADOW_2_COLOUR)
-                for widgetName in ["albumNameLabel", "artistNameLabel", "genresLabel", "releaseDateLabel"]:
-                    item.nametowidget("labelFrame").nametowidget(widgetName).config(bg=NAV_BAR_SHADOW_2_COLOUR)
-        # Set the background colour of the selected album item.
-        albumItem.config(bg=PRIMARY_BACKGROUND_COLOUR)
-        albumItem.nametowidget("labelFrame").config(bg=PRIMARY_BACKGROUND_COLOUR)
-        for widgetName in ["albumNameLabel", "artistNameLabel", "genresLabel", "releaseDateLabel"]:
-            albumItem.nametowidget("labelFrame").nametowidget(widgetName).config(bg=PRIMARY_BACKGROUND_COLOUR)
+        # Only the previously selected item and the new one change colour.
+        if self.selected_album is not None:
+            self.set_album_item_colour(self.selected_album, NAV_BAR_SHADOW_2_COLOUR)
+        self.set_album_item_colour(albumItem, PRIMARY_BACKGROUND_COLOUR)
         self.selected_album = albumItem  # Update the selected album reference.
     
     def tracks_album(self):
-        """Open a new window displaying the tracklist of the selected album."""
-        tracks_win = tk.Toplevel(self)
-        tracks_win.title("Tracks")
-        tracks_win.configure(background="#f0f0f0")
-        
+        """Open a window displaying the tracklist of the selected album."""
         if not self.selected_album:
             # Ensure an album is selected before showing tracks.
             messagebox.showerror("Error", "Please select an album to edit.")
             return
-        index = self.album_items.index(self.selected_album)  # Get the index of the selected album.
-        album = self.controller.albums[index]
-        tracklist = album["Tracklist"].split("; ")  # Split the tracklist into individual tracks.
-        
-        for i in range(0, len(tracklist)):
-            # Create and place a label for each track.
-            ttk.Label(tracks_win, text=tracklist[i]).grid(row=i, column=0, padx=5, pady=5, sticky="w")
+        album = self.get_selected_album()
+        tracklist = split_tracklist(album["Tracklist"])  # The individual tracks.
+        
+        tracks_win, is_new = self.pooled_window("tracks", "Tracks", "#f0f0f0")
+        if is_new:
+            # One multi-line label shows every track, instead of a label and grid call per track.
+            self.tracks_label = ttk.Label(tracks_win, justify="left")
+            self.tracks_label.grid(row=0, column=0, padx=5, pady=5, sticky="w")
+        self.tracks_label.config(text="\n".join(tracklist))
             
     def favourite_album(self):
         """Toggle the favourite status of the selected album."""
-        print(f"DEBUG: favourite_album called. Login check result: {check_login()}")
-        if not check_login():
+        logged_in = self.controller.is_logged_in
+        logger.debug("favourite_album called. Login check result: %s", logged_in)
+        if not logged_in:
             # Ensure the user is logged in before favouriting.
             messagebox.showerror("Error", "You must be logged in to favourite or unfavourite an album.")
             return
@@ -729,30 +1353,27 @@ class CatalogFrame(tk.Frame):
             messagebox.showerror("Error", "Please select an album to favourite or unfavourite.")
             return
 
-        # Determine the correct album list to use (filtered search results or full catalog).
-        album_list = self.controller.search_results if self.controller.search_results else self.controller.albums
-        index = self.album_items.index(self.selected_album)
-        album = album_list[index]
+        album = self.get_selected_album()
 
-        # Check if the user's favourites list exists; if not, initialize it.
-        if "favourites" not in self.controller.users[current_user]:
-            self.controller.users[current_user]["favourites"] = []
+        # Get the user's favourites (initialized if missing).
+        favourites = self.controller.user_favourites(current_user)
 
         # Toggle the album's favourite status.
-        if album["Deezer_ID"] in self.controller.users[current_user]["favourites"]:
-            self.controller.users[current_user]["favourites"].remove(album["Deezer_ID"])
+        if album["Deezer_ID"] in favourites:
+            del favourites[album["Deezer_ID"]]
             messagebox.showinfo("Success", f"Album '{album['Album']}' has been removed from your favourites.")
         else:
-            self.controller.users[current_user]["favourites"].append(album["Deezer_ID"])
+            favourites[album["Deezer_ID"]] = None
             messagebox.showinfo("Success", f"Album '{album['Album']}' has been added to your favourites.")
 
         # Save the updated favourites list.
-        self.controller.save_users()
+        self.controller.mark_users_dirty()
     
     def unfavourite_album(self):
         """Remove the selected album from the user's favourites."""
-        print(f"DEBUG: unfavourite_album called. Login check result: {check_login()}")
-        if not check_login():
+        logged_in = self.controller.is_logged_in
+        logger.debug("unfavourite_album called. Login check result: %s", logged_in)
+        if not logged_in:
             # Only logged in users can unfavourite albums.
             messagebox.showerror("Error", "You must be logged in to unfavourite an album.")
             return
@@ -762,10 +1383,7 @@ class CatalogFrame(tk.Frame):
             messagebox.showerror("Error", "Please select an album to unfavourite.")
             return
 
-        # Determine the album list to use (search results or full catalog).
-        album_list = self.controller.search_results if self.controller.search_results else self.controller.albums
-        index = self.album_items.index(self.selected_album)
-        album = album_list[index]
+        album = self.get_selected_album()
 
         # Ensure the user has a favourites list.
         if "favourites" not in self.controller.users[current_user]:
@@ -773,141 +1391,160 @@ class CatalogFrame(tk.Frame):
             return
 
         # Remove the album from favourites if it is present.
-        if album["Deezer_ID"] in self.controller.users[current_user]["favourites"]:
-            self.controller.users[current_user]["favourites"].remove(album["Deezer_ID"])
-            self.controller.save_users()
+        favourites = self.controller.user_favourites(current_user)
+        if album["Deezer_ID"] in favourites:
+            del favourites[album["Deezer_ID"]]
+            self.controller.mark_users_dirty()
             messagebox.showinfo("Success", f"Album '{album['Album']}' has been removed from your favourites.")
         else:
             messagebox.showerror("Error", f"Album '{album['Album']}' is not in your favourites.")
     
-    def add_album(self):
-        """Open a new window to add a new album to the catalog."""
-        print(f"DEBUG: add_album called. Login check result: {check_login()}")
-        if not check_login():
-            # Only logged in users can add an album.
-            messagebox.showerror("Error", "You must be logged in to add an album")
-            return
-        
-        # Create a new top-level window for adding an album.
-        add_win = tk.Toplevel(self, bg=PRIMARY_BACKGROUND_COLOUR)
-        add_win.title("Add Album")
-        add_win.grab_set()  # Make the window modal.
+    def open_filedialog_album_cover(self, file_label):
+        """Open a file dialog to select an album cover image for the open album form."""
+        self.current_file_path = filedialog.askopenfilename(
+            title="Select a File",
+            filetypes=ALBUM_COVER_FILETYPES,
+            initialdir="./Code")
+        if self.current_file_path:
+            self.current_file_path = os.path.relpath(self.current_file_path, start=APP_BASE_DIR)
+            file_label.config(text=f"Selected file: {self.current_file_path}")
+        else:
+            file_label.config(text="No file selected.")
+    
+    def add_track(self, tracks_list, tracks_list_add_entry):
+        """Add the entered track to the end of a numbered tracks list."""
+        if tracks_list_add_entry.get() != "":
+            track_name = tracks_list_add_entry.get()
+            tracks_list.insert(tk.END, f"{tracks_list.size() + 1}. {track_name}")
+            tracks_list_add_entry.delete(0, tk.END)
+    
+    def hide_window(self, window):
+        """Hide a pooled dialog window so the next open can reuse it."""
+        window.grab_release()
+        window.withdraw()
+    
+    def pooled_window(self, name, title, background):
+        """Return (window, is_new) for the dialog window called name, creating it on first use.
+        
+        Dialogs are hidden rather than destroyed when closed, and shown again here on the next open.
+        """
+        window = self.dialog_windows.get(name)
+        if window is not None and window.winfo_exists():
+            window.deiconify()
+            return window, False
+        window = self.dialog_windows[name] = tk.Toplevel(self, bg=background)
+        window.title(title)
+        window.protocol("WM_DELETE_WINDOW", lambda: self.hide_window(window))
+        return window, True
+    
+    def _build_album_form(self, window):
+        """Build the album form shared by the add and edit windows.
         
+        Returns a dict of the entry widgets keyed by album field, the tracks Listbox,
+        the new track entry and the cover file label.
+        """
+        entries = {}
         # Create labels and entry fields for album details.
-        ttk.Label(add_win, text="Artist Name:").grid(row=0, column=0, padx=5, pady=5, sticky="e")
-        artist_entry = ttk.Entry(add_win)
-        artist_entry.grid(row=0, column=1, padx=5, pady=5)
-        
-        ttk.Label(add_win, text="Album:").grid(row=1, column=0, padx=5, pady=5, sticky="e")
-        album_entry = ttk.Entry(add_win)
-        album_entry.grid(row=1, column=1, padx=5, pady=5)
-        
-        ttk.Label(add_win, text="Release Date:").grid(row=2, column=0, padx=5, pady=5, sticky="e")
-        release_entry = ttk.Entry(add_win)
-        release_entry.grid(row=2, column=1, padx=5, pady=5)
-        
-        ttk.Label(add_win, text="Genres:").grid(row=3, column=0, padx=5, pady=5, sticky="e")
-        genres_entry = ttk.Entry(add_win)
-        genres_entry.grid(row=3, column=1, padx=5, pady=5)
-        
-        self.current_file_path = ""  # Variable to store selected album cover file path.
-        def open_filedialog_album_cover():
-            """Open a file dialog to select an album cover image."""
-            self.current_file_path = filedialog.askopenfilename(
-                title="Select a File",
-                filetypes=[("Image Files", ["*.png","*.jpg","*.jpeg","*.gif"]), ("All Files", "*.*")],
-                initialdir="./Code")
-            if self.current_file_path:
-                self.current_file_path = os.path.relpath(self.current_file_path, start=os.getcwd())
-                file_label.config(text=f"Selected file: {self.current_file_path}")
-            else:
-                file_label.config(text="No file selected.")
+        for row, (field, text) in enumerate(ALBUM_FORM_FIELDS):
+            ttk.Label(window, text=text).grid(row=row, column=0, padx=5, pady=5, sticky="e")
+            entry = entries[field] = ttk.Entry(window)
+            entry.grid(row=row, column=1, padx=5, pady=5)
         
-        ttk.Label(add_win, text="Album Cover:").grid(row=4, column=0, padx=5, pady=5, sticky="e")
-        album_url_entry = ttk.Entry(add_win)
+        ttk.Label(window, text="Album Cover:").grid(row=4, column=0, padx=5, pady=5, sticky="e")
+        album_url_entry = entries["Cover URL"] = ttk.Entry(window)
         album_url_entry.grid(row=4, column=1, padx=5, pady=5)
-        album_image_entry = ttk.Button(add_win, text="Import File", command=open_filedialog_album_cover)
+        album_image_entry = ttk.Button(window, text="Import File", command=lambda: self.open_filedialog_album_cover(file_label))
         album_image_entry.grid(row=4, column=2, padx=5, pady=5)
-        file_label = tk.Label(add_win, text="No file selected.")
+        file_label = tk.Label(window, text="No file selected.")
         file_label.grid(row=4, column=3, padx=5, pady=5)
 
-        ttk.Label(add_win, text="Tracks:").grid(row=5, column=0, padx=5, pady=5, sticky="e")
-        tracks_list = tk.Listbox(add_win)
+        ttk.Label(window, text="Tracks:").grid(row=5, column=0, padx=5, pady=5, sticky="e")
+        tracks_list = tk.Listbox(window)
         tracks_list.grid(row=5, column=1, padx=5, pady=5)
 
-        def add_track() -> None:
-            """Add a new track to the tracks list."""
-            if tracks_list_add_entry.get() != "":
-                track_name = tracks_list_add_entry.get()
-                tracks_list.insert(tk.END, f"{tracks_list.size() + 1}. {track_name}")
-                tracks_list_add_entry.delete(0, tk.END)
-
-        def delete_track() -> None:
-            """Delete the selected track and re-index the remaining tracks."""
-            if len(tracks_list.curselection()) == 1:
-                indexToDelete = tracks_list.curselection()[0]
-                newIndexedTracks = []
-                i = indexToDelete + 1
-                for track_string in tracks_list.get(indexToDelete + 1, tk.END):
-                    if len(track_string.split('. ')) > 1:
-                        newIndexedTracks.append(f"{i}. {track_string.split('. ')[1]}")
-                        i += 1
-                
-                tracks_list.delete(indexToDelete, tk.END)
-
-                for track_string in newIndexedTracks:
-                    tracks_list.insert(tk.END, track_string)
-
-        tracks_list_delete_button = ttk.Button(add_win, text="Delete Selected Track", command=delete_track)
+        tracks_list_delete_button = ttk.Button(window, text="Delete Selected Track", command=lambda: delete_track(tracks_list))
         tracks_list_delete_button.grid(row=5, column=2, padx=5, pady=5)
-        tracks_list_add_entry = ttk.Entry(add_win)
+        tracks_list_add_entry = ttk.Entry(window)
         tracks_list_add_entry.grid(row=5, column=3, padx=5, pady=5)
-        tracks_list_add_button = ttk.Button(add_win, text="Add Track", command=add_track)
+        tracks_list_add_button = ttk.Button(window, text="Add Track", command=lambda: self.add_track(tracks_list, tracks_list_add_entry))
         tracks_list_add_button.grid(row=5, column=4, padx=5, pady=5)
+        return entries, tracks_list, tracks_list_add_entry, file_label
+    
+    def fill_album_form(self, entries, tracks_list, tracks_list_add_entry, file_label, album):
+        """Reset the album form to the details of album (an empty dict for a new album)."""
+        for field, entry in entries.items():
+            entry.delete(0, tk.END)
+            if field != "Cover URL":
+                entry.insert(0, album.get(field, ""))
+        tracks_list_add_entry.delete(0, tk.END)
+        
+        # Determine whether to populate the cover URL as a web URL or a local file.
+        self.current_file_path = ""  # Variable to store selected album cover file path.
+        file_label.config(text="No file selected.")
+        cover_url = album.get("Cover URL") or ""
+        if _is_url(cover_url):
+            entries["Cover URL"].insert(0, cover_url)
+        elif cover_url != "":
+            self.current_file_path = cover_url
+            file_label.config(text=f"Selected file: {self.current_file_path}")
+        
+        # Populate the tracks list with existing track data in a single insert call.
+        tracks_list.delete(0, tk.END)
+        tracks_list.insert(tk.END, *split_tracklist(album.get("Tracklist")))
+    
+    def open_album_form(self, name, title, button_text, album, on_save):
+        """Show the (pooled) album form window called name filled from album; its button calls on_save.
+        
+        on_save is called with the window, the entries dict and the tracks Listbox.
+        """
+        window, is_new = self.pooled_window(name, title, PRIMARY_BACKGROUND_COLOUR)
+        if is_new:
+            self.album_forms[name] = (*self._build_album_form(window), ttk.Button(window, text=button_text))
+            self.album_forms[name][-1].grid(row=6, column=0, columnspan=2, pady=10)
+        entries, tracks_list, tracks_list_add_entry, file_label, action_button = self.album_forms[name]
+        self.fill_album_form(entries, tracks_list, tracks_list_add_entry, file_label, album)
+        action_button.config(command=lambda: on_save(window, entries, tracks_list))
+        window.grab_set()  # Make the window modal.
+    
+    def read_album_form(self, entries, tracks_list):
+        """Return the stripped field values of an album form, or None after reporting missing required fields."""
+        values = {field: entry.get().strip() for field, entry in entries.items()}
+        values["Tracklist"] = list(tracks_list.get(0, tk.END))  # The tracklist, one string per track.
+        if self.current_file_path != "":
+            values["Cover URL"] = self.current_file_path
+        if not values["Artist Name"] or not values["Album"] or not values["Release Date"]:
+            messagebox.showerror("Error", "Artist Name, Album, and Release Date are required.")
+            return None
+        return values
+    
+    def add_album(self):
+        """Open a new window to add a new album to the catalog."""
+        logged_in = self.controller.is_logged_in
+        logger.debug("add_album called. Login check result: %s", logged_in)
+        if not logged_in:
+            # Only logged in users can add an album.
+            messagebox.showerror("Error", "You must be logged in to add an album")
+            return
 
-        def save_album():
+        def save_album(add_win, entries, tracks_list):
             """Save the new album to the catalog and update the CSV file."""
-            artist = artist_entry.get().strip()
-            album_name = album_entry.get().strip()
-            release_date = release_entry.get().strip()
-            genres = genres_entry.get().strip()
-            cover_url = album_url_entry.get().strip()
-            track_list_string = ""
-
-            # Concatenate all tracks into a single string separated by semicolons.
-            for track_string in tracks_list.get(0, tk.END):
-                track_list_string = track_list_string + track_string + "; "
-
-            if self.current_file_path != "":
-                cover_url = self.current_file_path
-            if not artist or not album_name or not release_date:
-                messagebox.showerror("Error", "Artist Name, Album, and Release Date are required.")
+            values = self.read_album_form(entries, tracks_list)
+            if values is None:
                 return
-            new_album = {
-                "Ranking": 0,
-                "Artist Name": artist,
-                "Album": album_name,
-                "Release Date": release_date,
-                "Genres": genres,
-                "Average Rating": 0,
-                "Number of Ratings": 0,
-                "Number of Reviews": 0,
-                "Cover URL": cover_url,
-                "Tracklist": track_list_string,
-                "Deezer_ID": ""
-            }
+            new_album = {**DEFAULT_ALBUM, **values}
             self.controller.albums.append(new_album)  # Add the new album to the catalog.
-            self.controller.save_albums()  # Save albums to the CSV file.
-            self.refresh_album_list()  # Refresh the displayed album list.
-            add_win.destroy()  # Close the add album window.
+            self.controller.mark_albums_dirty(new_albums=[new_album])  # Append the new album to the CSV file.
+            self.redraw_album_rows(len(self.controller.albums) - 1)  # Show the new album at the end of the list.
+            self.hide_window(add_win)  # Close the add album window.
         
-        ttk.Button(add_win, text="Save Album", command=save_album).grid(row=6, column=0, columnspan=2, pady=10)
+        self.open_album_form("add_album", "Add Album", "Save Album", {}, save_album)
     
     def edit_album(self, force=False):
         """Open a window to edit the selected album's details."""
-        print(f"DEBUG: edit_album called. Login check result: {check_login()}")
+        logged_in = self.controller.is_logged_in
+        logger.debug("edit_album called. Login check result: %s", logged_in)
         if not force:
-            if not check_login():
+            if not logged_in:
                 messagebox.showerror("Error", "You must be logged in to edit an album")
                 return
                 
@@ -915,145 +1552,28 @@ class CatalogFrame(tk.Frame):
                 messagebox.showerror("Error", "Please select an album to edit.")
                 return
         
-        index = self.album_items.index(self.selected_album)  # Get the index of the selected album.
-        album = self.controller.albums[index]
-        
-        # Create a new window for editing album details.
-        edit_win = tk.Toplevel(self, bg=PRIMARY_BACKGROUND_COLOUR)
-        edit_win.title("Edit Album")
-        edit_win.grab_set()  # Make the window modal.
-        
-        # Create labels and pre-populated entry fields for album details.
-        ttk.Label(edit_win, text="Artist Name:").grid(row=0, column=0, padx=5, pady=5, sticky="e")
-        artist_entry = ttk.Entry(edit_win)
-        artist_entry.insert(0, album.get("Artist Name", ""))
-        artist_entry.grid(row=0, column=1, padx=5, pady=5)
-        
-        ttk.Label(edit_win, text="Album:").grid(row=1, column=0, padx=5, pady=5, sticky="e")
-        album_entry = ttk.Entry(edit_win)
-        album_entry.insert(0, album.get("Album", ""))
-        album_entry.grid(row=1, column=1, padx=5, pady=5)
-        
-        ttk.Label(edit_win, text="Release Date:").grid(row=2, column=0, padx=5, pady=5, sticky="e")
-        release_entry = ttk.Entry(edit_win)
-        release_entry.insert(0, album.get("Release Date", ""))
-        release_entry.grid(row=2, column=1, padx=5, pady=5)
-        
-        ttk.Label(edit_win, text="Genres:").grid(row=3, column=0, padx=5, pady=5, sticky="e")
-        genres_entry = ttk.Entry(edit_win)
-        genres_entry.insert(0, album.get("Genres", ""))
-        genres_entry.grid(row=3, column=1, padx=5, pady=5)
-        
-        self.current_file_path = ""  # Reset the file path for the album cover.
-        def open_filedialog_album_cover():
-            """Open a file dialog to select a new album cover."""
-            self.current_file_path = filedialog.askopenfilename(
-                title="Select a File",
-                filetypes=[("Image Files", ["*.png","*.jpg","*.jpeg","*.gif"]), ("All Files", "*.*")],
-                initialdir="./Code")
-            if self.current_file_path:
-                self.current_file_path = os.path.relpath(self.current_file_path, start=os.getcwd())
-                file_label.config(text=f"Selected file: {self.current_file_path}")
-            else:
-                file_label.config(text="No file selected.")
-        
-        ttk.Label(edit_win, text="Album Cover:").grid(row=4, column=0, padx=5, pady=5, sticky="e")
-        album_url_entry = ttk.Entry(edit_win)
-        album_url_entry.grid(row=4, column=1, padx=5, pady=5)
-        album_image_entry = ttk.Button(edit_win, text="Import File", command=open_filedialog_album_cover)
-        album_image_entry.grid(row=4, column=2, padx=5, pady=5)
-        file_label = tk.Label(edit_win, text="No file selected.")
-        file_label.grid(row=4, column=3, padx=5, pady=5)
-        
-        # Determine whether to populate the cover URL as a web URL or a local file.
-        if URL_PATTERN.match(album.get("Cover URL", "")):
-            album_url_entry.insert(0, album.get("Cover URL", ""))
-        elif album.get("Cover URL", "") != "" and album.get("Cover URL", "") is not None:
-            self.current_file_path = album.get("Cover URL", "")
-            file_label.config(text=f"Selected file: {self.current_file_path}")
-
-        ttk.Label(edit_win, text="Tracks:").grid(row=5, column=0, padx=5, pady=5, sticky="e")
-        tracks_list = tk.Listbox(edit_win)
-        tracks_list.grid(row=5, column=1, padx=5, pady=5)
-
-        # Populate the tracks list with existing track data.
-        for track_string in album.get("Tracklist").split(";"):
-            if track_string.strip() != "":
-                tracks_list.insert(tk.END, track_string)
-
-        def add_track() -> None:
-            """Add a new track to the tracks list."""
-            if tracks_list_add_entry.get() != "":
-                track_name = tracks_list_add_entry.get()
-                tracks_list.insert(tk.END, f"{tracks_list.size() + 1}. {track_name}")
-                tracks_list_add_entry.delete(0, tk.END)
-
-        def delete_track() -> None:
-            """Delete the selected track and update track numbering."""
-            if len(tracks_list.curselection()) == 1:
-                indexToDelete = tracks_list.curselection()[0]
-                newIndexedTracks = []
-                i = indexToDelete + 1
-                for track_string in tracks_list.get(indexToDelete + 1, tk.END):
-                    if len(track_string.split('. ')) > 1:
-                        newIndexedTracks.append(f"{i}. {track_string.split('. ')[1]}")
-                        i += 1
-                
-                tracks_list.delete(indexToDelete, tk.END)
-
-                for track_string in newIndexedTracks:
-                    tracks_list.insert(tk.END, track_string)
-
-        tracks_list_delete_button = ttk.Button(edit_win, text="Delete Selected Track", command=delete_track)
-        tracks_list_delete_button.grid(row=5, column=2, padx=5, pady=5)
-        tracks_list_add_entry = ttk.Entry(edit_win)
-        tracks_list_add_entry.grid(row=5, column=3, padx=5, pady=5)
-        tracks_list_add_button = ttk.Button(edit_win, text="Add Track", command=add_track)
-        tracks_list_add_button.grid(row=5, column=4, padx=5, pady=5)
+        index = self.album_index_by_item[self.selected_album]  # Position of the selected album in the displayed list.
+        album = self.get_selected_album()  # The album itself, which may be a search result or favourite.
         
-        def update_album():
+        def update_album(edit_win, entries, tracks_list):
             """Update the album with new details from the edit form."""
-            updated_artist = artist_entry.get().strip()
-            updated_album = album_entry.get().strip()
-            updated_release = release_entry.get().strip()
-            updated_genres = genres_entry.get().strip()
-            cover_url = album_url_entry.get().strip()
-            track_list_string = ""
-
-            # Concatenate the tracks into a single string.
-            for track_string in tracks_list.get(0, tk.END):
-                track_list_string = track_list_string + track_string + "; "
-
-            if self.current_file_path != "":
-                cover_url = self.current_file_path
-            if not updated_artist or not updated_album or not updated_release:
-                messagebox.showerror("Error", "Artist Name, Album, and Release Date are required.")
+            values = self.read_album_form(entries, tracks_list)
+            if values is None:
                 return
-            # Update the album details in the controller's album list.
-            self.controller.albums[index] = {
-                "Ranking": album["Ranking"],
-                "Artist Name": updated_artist,
-                "Album": updated_album,
-                "Release Date": updated_release,
-                "Genres": updated_genres,
-                "Average Rating": album["Average Rating"],
-                "Number of Ratings": album["Number of Ratings"],
-                "Number of Reviews": album["Number of Reviews"],
-                "Cover URL": cover_url,
-                "Tracklist": track_list_string,
-                "Deezer_ID": ""
-            }
-            self.controller.save_albums()  # Save the updated album list.
-            self.refresh_album_list()  # Refresh the display.
-            edit_win.destroy()  # Close the edit window.
-        
-        ttk.Button(edit_win, text="Update Album", command=update_album).grid(row=6, column=0, columnspan=2, pady=10)
+            # Update the album in place, so every list holding it (such as search results) sees the new details.
+            album.update(values, Deezer_ID="")
+            self.controller.mark_albums_dirty()  # Save the updated album list.
+            self.redraw_album_rows(index)  # Redraw the edited album item.
+            self.hide_window(edit_win)  # Close the edit window.
+        
+        self.open_album_form("edit_album", "Edit Album", "Update Album", album, update_album)
     
     def delete_album(self, force=False):
         """Delete the selected album from the catalog."""
-        print(f"DEBUG: delete_album called. Login check result: {check_login()}")
+        logged_in = self.controller.is_logged_in
+        logger.debug("delete_album called. Login check result: %s", logged_in)
         if not force:
-            if not check_login():
+            if not logged_in:
                 messagebox.showerror("Error", "You must be logged in to delete an album")
                 return
                 
@@ -1061,12 +1581,19 @@ class CatalogFrame(tk.Frame):
                 messagebox.showerror("Error", "Please select an album to delete.")
                 return
         
-        index = self.album_items.index(self.selected_album)  # Get the index of the selected album.
+        index = self.album_index_by_item[self.selected_album]  # Position of the selected album in the displayed list.
+        album = self.get_selected_album()
         confirm = messagebox.askyesno("Confirm Delete", "Are you sure you want to delete the selected album?")
         if confirm:
-            del self.controller.albums[index]  # Remove the album from the list.
-            self.controller.save_albums()  # Save the updated album list.
-            self.refresh_album_list()  # Refresh the display.
+            # Find the album in the catalog by identity; a search or favourites list has its own positions.
+            catalogIndex = next(i for i, catalogAlbum in enumerate(self.controller.albums) if catalogAlbum is album)
+            del self.controller.albums[catalogIndex]  # Remove the album from the catalog.
+            self.controller.mark_albums_dirty()  # Save the updated album list.
+            if self.displayed_albums is self.controller.albums:
+                self.redraw_album_rows(catalogIndex)  # Move the album items after it up.
+            else:
+                del self.displayed_albums[index]  # Also drop it from the search results being shown.
+                self.refresh_album_list()
     
     def edit_account(self):
         """Open a window to allow the user to edit their account details."""
@@ -1075,37 +1602,60 @@ class CatalogFrame(tk.Frame):
             messagebox.showerror("Error", "No user is logged in.")
             return
         
-        # Create a new window for editing account details.
-        edit_win = tk.Toplevel(self)
-        edit_win.title("Edit Account")
-        edit_win.configure(background="#f0f0f0")
+        # Show the window for editing account details, building it on first use.
+        edit_win, is_new = self.pooled_window("edit_account", "Edit Account", "#f0f0f0")
+        if is_new:
+            # Create fields for current password, new username, and new password.
+            ttk.Label(edit_win, text="Current Password:").grid(row=0, column=0, padx=5, pady=5, sticky="e")
+            current_pass_entry = ttk.Entry(edit_win, show="*")
+            current_pass_entry.grid(row=0, column=1, padx=5, pady=5)
+            
+            ttk.Label(edit_win, text="New Username:").grid(row=1, column=0, padx=5, pady=5, sticky="e")
+            new_username_entry = ttk.Entry(edit_win)
+            new_username_entry.grid(row=1, column=1, padx=5, pady=5)
+            
+            ttk.Label(edit_win, text="New Password:").grid(row=2, column=0, padx=5, pady=5, sticky="e")
+            new_pass_entry = ttk.Entry(edit_win, show="*")
+            new_pass_entry.grid(row=2, column=1, padx=5, pady=5)
+            
+            ttk.Label(edit_win, text="Confirm New Password:").grid(row=3, column=0, padx=5, pady=5, sticky="e")
+            confirm_new_pass_entry = ttk.Entry(edit_win, show="*")
+            confirm_new_pass_entry.grid(row=3, column=1, padx=5, pady=5)
+            
+            update_button = ttk.Button(edit_win, text="Update Account")
+            update_button.grid(row=4, column=0, columnspan=2, pady=10)
+            self.account_form = (current_pass_entry, new_username_entry, new_pass_entry, confirm_new_pass_entry, update_button)
+        current_pass_entry, new_username_entry, new_pass_entry, confirm_new_pass_entry, update_button = self.account_form
+        # Clear anything left over from the last time the window was open.
+        for entry in self.account_form[:4]:
+            entry.delete(0, tk.END)
+        update_button.config(state="normal")
         edit_win.grab_set()  # Make the window modal.
         
-        # Create fields for current password, new username, and new password.
-        ttk.Label(edit_win, text="Current Password:").grid(row=0, column=0, padx=5, pady=5, sticky="e")
-        current_pass_entry = ttk.Entry(edit_win, show="*")
-        current_pass_entry.grid(row=0, column=1, padx=5, pady=5)
-        
-        ttk.Label(edit_win, text="New Username:").grid(row=1, column=0, padx=5, pady=5, sticky="e")
-        new_username_entry = ttk.Entry(edit_win)
-        new_username_entry.grid(row=1, column=1, padx=5, pady=5)
-        
-        ttk.Label(edit_win, text="New Password:").grid(row=2, column=0, padx=5, pady=5, sticky="e")
-        new_pass_entry = ttk.Entry(edit_win, show="*")
-        new_pass_entry.grid(row=2, column=1, padx=5, pady=5)
-        
-        ttk.Label(edit_win, text="Confirm New Password:").grid(row=3, column=0, padx=5, pady=5, sticky="e")
-        confirm_new_pass_entry = ttk.Entry(edit_win, show="*")
-        confirm_new_pass_entry.grid(row=3, column=1, padx=5, pady=5)
-        
         def update_account():
-            """Update the user's account details after validating current credentials."""
+            """Check the current password, off the Tk thread when that means running the password hash."""
+            stored = self.controller.users[current_user]["password"]
             current_pass = current_pass_entry.get()
+            if not is_password_hash(stored):
+                finish_update_account(verify_password(stored, current_pass))
+                return
+            update_button.config(state="disabled")  # Ignore further clicks until the check is done.
+            future = self.controller.background_executor.submit(verify_password, stored, current_pass)
+            # Continue on the Tk thread once the check is done.
+            self.controller.call_when_done(future, finish_verification)
+        
+        def finish_verification(future):
+            """Continue the account update on the Tk thread with the result of the password check."""
+            update_button.config(state="normal")
+            finish_update_account(future.result())
+        
+        def finish_update_account(password_ok):
+            """Update the user's account details once the current password has been checked."""
             new_username = new_username_entry.get().strip()
             new_pass = new_pass_entry.get()
             confirm_new_pass = confirm_new_pass_entry.get()
             
-            if self.controller.users[current_user]["password"] != current_pass:
+            if not password_ok:
                 messagebox.showerror("Error", "Current password is incorrect.")
                 return
             
@@ -1127,22 +1677,24 @@ class CatalogFrame(tk.Frame):
                 if not new_pass:
                     messagebox.showerror("Error", "New password cannot be empty.")
                     return
-                self.controller.users[updated_username]["password"] = new_pass  # Update the password.
+                self.controller.users[updated_username]["password"] = hash_password(new_pass)  # Update the password.
             
-            self.controller.save_users()  # Save updated user data.
+            if updated_username != current_user or new_pass:
+                self.controller.mark_users_dirty()  # Save updated user data; an unchanged account is not rewritten.
             messagebox.showinfo("Success", "Account updated successfully!")
-            edit_win.destroy()  # Close the edit account window.
+            self.hide_window(edit_win)  # Close the edit account window.
         
-        ttk.Button(edit_win, text="Update Account", command=update_account).grid(row=4, column=0, columnspan=2, pady=10)
+        update_button.config(command=update_account)
     
     def logout(self):
         """Log out the current user and reset UI elements accordingly."""
+        self.controller.flush_pending_saves()  # Write the user's pending changes now.
         self.controller.current_user = None  # Clear the controller's current user.
         # Reset global login state variables.
         global current_user, is_logged_in
         current_user = None
         is_logged_in = False
-        print(f"DEBUG: User logged out. is_logged_in = {is_logged_in}")
+        logger.debug("User logged out. is_logged_in = %s", is_logged_in)
         messagebox.showinfo("Logout", "You have been logged out.")
         # Hide buttons and fields that are only visible to logged in users.
         self.controller.favourites_button.pack_forget()
@@ -1154,5 +1706,7 @@ class CatalogFrame(tk.Frame):
         self.controller.show_frame("LoginFrame")
 
 if __name__ == "__main__":
+    if __debug__ and os.environ.get("BB_DEBUG"):
+        logging.basicConfig(level=logging.DEBUG)  # Opt-in debug output; silent by default.
     app = AlbumCatalogApp()  # Create an instance of the main application.
     app.mainloop()  # Start the Tkinter event loop.
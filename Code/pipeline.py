@@ -1,38 +1,50 @@
 import requests
 import time
+import json
+import os
 import pandas as pd
 
+# Shared HTTP session: Discogs and Deezer calls reuse keep-alive connections
+# instead of paying a new TCP/TLS handshake per album.
+session = requests.Session()
+session.headers.update({"User-Agent": "MyMusicApp/1.0"})
+
 # Discogs API credentials
 DISCOGS_API_URL = "https://api.discogs.com/database/search"
 DISCOGS_TOKEN = "Your Discogs API key"
+# Cover URLs already returned by Discogs, keyed by "album|artist", so re-running
+# the pipeline does not re-query (and re-rate-limit) albums it has seen before.
+DISCOGS_CACHE_FILE = "discogs_cache.json"
+
 
+def parse_release_dates(dates):
+    """Parse a column of full, month-only and year-only date strings in vectorized passes."""
+    dates = dates.str.strip()
+    parsed = pd.to_datetime(dates, format='%d %B %Y', errors='coerce')  # Full date (e.g., "16 June 1997")
+    parsed = parsed.fillna(pd.to_datetime(dates, format='%B %Y', errors='coerce'))  # Month + Year (e.g., "July 1963")
+    return parsed.fillna(pd.to_datetime(dates, format='%Y', errors='coerce'))  # Year only (e.g., "1975")
 
-def clean_date(date_str):
-    """Clean and standardize date strings."""
-    parts = date_str.strip().split()
-    if len(parts) == 1:  # Year only (e.g., "1975")
-        return f"1 January {parts[0]}"
-    elif len(parts) == 2:  # Month + Year (e.g., "July 1963")
-        return f"1 {parts[0]} {parts[1]}"
-    else:  # Full date (e.g., "16 June 1997")
-        return date_str
+# Column types of the raw scraped CSV, applied while parsing so pandas can
+# skip dtype inference and the numeric columns never pass through object arrays.
+RAW_CSV_DTYPES = {
+    'Ranking': 'int64',
+    'Album': 'string',
+    'Artist Name': 'string',
+    'Release Date': 'string',
+    'Genres': 'string',
+    'Average Rating': 'float64',
+    'Number of Ratings': 'int64',
+}
 
 def data_cleaning_pipeline(input_csv, output_csv):
     """Pipeline to clean and transform the CSV data."""
-    # Load raw data
-    df = pd.read_csv(input_csv)
+    # Load raw data with explicit types ("70,382" style counts are parsed via thousands=',')
+    df = pd.read_csv(input_csv, dtype=RAW_CSV_DTYPES, thousands=',', engine='c')
 
     # 1. Clean 'Release Date' and convert to datetime
-    df['Release Date'] = df['Release Date'].apply(clean_date)
-    df['Release Date'] = pd.to_datetime(df['Release Date'], format='%d %B %Y', errors='coerce')
+    df['Release Date'] = parse_release_dates(df['Release Date'])
 
-    # 2. Convert data types
-    df['Number of Ratings'] = df['Number of Ratings'].str.replace(',', '').astype(int)
-    text_columns = ['Album', 'Artist Name', 'Genres']
-    df[text_columns] = df[text_columns].astype("string")
-    df['Ranking'] = df['Ranking'].astype(int)
-    df['Average Rating'] = df['Average Rating'].astype(float)
-    df['Number of Ratings'] = df['Number of Ratings'].astype(int)
+    # 2. Data types are already set by read_csv (see RAW_CSV_DTYPES)
 
     # 3. Filter the data
     df = df[df['Ranking'] <= 1000]
@@ -48,7 +60,6 @@ def data_cleaning_pipeline(input_csv, output_csv):
 
 def get_album_cover(album, artist):
     """Fetch album cover URL from Discogs API."""
-    headers = {"User-Agent": "MyMusicApp/1.0"}
     params = {
         "q": album,
         "artist": artist,
@@ -56,7 +67,7 @@ def get_album_cover(album, artist):
         "token": DISCOGS_TOKEN
     }
 
-    response = requests.get(DISCOGS_API_URL, headers=headers, params=params)
+    response = session.get(DISCOGS_API_URL, params=params)
     
     if response.status_code == 200:
         data = response.json()
@@ -64,23 +75,87 @@ def get_album_cover(album, artist):
             return data["results"][0].get("cover_image", None)
     return None
 
+def load_discogs_cache(cache_file=DISCOGS_CACHE_FILE):
+    """Load previously fetched Discogs cover URLs."""
+    if os.path.exists(cache_file):
+        with open(cache_file, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return {}
+
+def save_discogs_cache(cache, cache_file=DISCOGS_CACHE_FILE):
+    """Persist fetched Discogs cover URLs for the next run."""
+    with open(cache_file, "w", encoding="utf-8") as f:
+        json.dump(cache, f)
+
+def append_checkpoint(checkpoint, index, **fields):
+    """Append the fields fetched for one row to an open JSONL checkpoint file."""
+    checkpoint.write(json.dumps({"index": int(index), **fields}) + "\n")
+
+def apply_checkpoint(df, checkpoint_file):
+    """Merge a JSONL checkpoint from an interrupted run into df and return the row indexes it covers."""
+    if not os.path.exists(checkpoint_file):
+        return set()
+    with open(checkpoint_file, "r", encoding="utf-8") as f:
+        lines = [line for line in f if line.strip()]
+    records = []
+    for number, line in enumerate(lines, 1):
+        try:
+            records.append(json.loads(line))
+        except json.JSONDecodeError:
+            if number < len(lines):
+                raise
+            # The run was stopped while writing its last line: drop it (that row is fetched
+            # again) so the lines appended by this run do not run on from it.
+            with open(checkpoint_file, "w", encoding="utf-8") as f:
+                f.writelines(lines[:-1])
+    if not records:
+        return set()
+    records = pd.DataFrame(records, dtype=object)  # Keep IDs as ints and missing values as None
+    records = records.drop_duplicates("index", keep="last").set_index("index")
+    for column in records.columns:
+        if column not in df.columns:
+            df[column] = None
+        df[column] = df[column].astype(object)
+        df.loc[records.index, column] = records[column].astype(object).where(records[column].notna(), None)
+    return set(records.index)
+
 def fetch_album_covers(csv_file):
     """Fetch album covers and update CSV."""
     df = pd.read_csv(csv_file)
+    cache = load_discogs_cache()
 
-    for index, row in df.iterrows():
-        if pd.notna(row.get("Cover URL")) and row["Cover URL"].startswith("http"):
-            print(f"Skipping {row['Album']} - Cover already exists.")
-            continue  # Skip albums with a cover
+    # Rows fetched by an interrupted run are recorded here, one JSON line each
+    checkpoint_file = f"{csv_file}.covers.jsonl"
+    done = apply_checkpoint(df, checkpoint_file)
 
-        cover_url = get_album_cover(row["Album"], row["Artist Name"])
-        df.at[index, "Cover URL"] = cover_url
-        print(f"Fetched cover for {row['Album']}: {cover_url}")
+    # Work out which albums still need a cover in one vectorized pass
+    if "Cover URL" not in df.columns:
+        df["Cover URL"] = None
+    has_cover = df["Cover URL"].astype(str).str.startswith("http")
+    print(f"Skipping {int(has_cover.sum())} albums - Cover already exists.")
+    todo = df.index[~has_cover & ~df.index.isin(list(done))]
 
-        time.sleep(1)  # Rate limiting
+    with open(checkpoint_file, "a", encoding="utf-8", buffering=1) as checkpoint:
+        for index, album, artist in zip(todo, df.loc[todo, "Album"], df.loc[todo, "Artist Name"]):
+            cache_key = f"{album}|{artist}"
+            if cache_key in cache:
+                df.at[index, "Cover URL"] = cache[cache_key]
+                print(f"Using cached cover for {album}")
+                continue  # No request made, so no rate limiting needed
 
-    # Save updated CSV
+            cover_url = get_album_cover(album, artist)
+            df.at[index, "Cover URL"] = cover_url
+            print(f"Fetched cover for {album}: {cover_url}")
+            if cover_url:
+                cache[cache_key] = cover_url  # Only cache hits so misses are retried next run
+            append_checkpoint(checkpoint, index, **{"Cover URL": cover_url})
+
+            time.sleep(1)  # Rate limiting
+
+    # Save updated CSV once; the checkpoint is then redundant
     df.to_csv(csv_file, index=False)
+    save_discogs_cache(cache)
+    os.remove(checkpoint_file)
     print(f"Updated CSV with album covers: {csv_file}")
 
 
@@ -95,7 +170,7 @@ def search_deezer_album(album_name, artist_name):
         "q": f"artist:'{artist_name}' album:'{album_name}'"
     }
     
-    response = requests.get(search_url, params=params)
+    response = session.get(search_url, params=params)
     
     if response.status_code == 200:
         data = response.json()
@@ -109,7 +184,7 @@ def get_album_tracklist(album_id):
         return []
     
     tracklist_url = f"{DEEZER_API_URL}/album/{album_id}/tracks"
-    response = requests.get(tracklist_url)
+    response = session.get(tracklist_url)
     
     if response.status_code == 200:
         data = response.json()
@@ -135,37 +210,51 @@ def fetch_album_tracklists(csv_file):
     # Add column for Deezer ID if it doesn't exist
     if "Deezer_ID" not in df.columns:
         df["Deezer_ID"] = None
+
+    # Rows processed by an interrupted run are recorded here, one JSON line each
+    checkpoint_file = f"{csv_file}.tracklists.jsonl"
+    done = apply_checkpoint(df, checkpoint_file)
     
-    for index, row in df.iterrows():
-        # Skip if tracklist already exists
-        if pd.notna(row.get("Tracklist")) and row["Tracklist"]:
-            print(f"Skipping {row['Album']} - Tracklist already exists.")
-            continue
-        
-        print(f"Processing {row['Album']} by {row['Artist Name']}...")
-        
-        # Step 1: Get album ID
-        album_id = search_deezer_album(row["Album"], row["Artist Name"])
-        df.at[index, "Deezer_ID"] = album_id
-        
-        if album_id:
-            # Step 2: Get tracklist
-            tracklist = get_album_tracklist(album_id)
-            if tracklist:
-                # Convert tracklist to a string representation
-                tracklist_str = "; ".join([f"{t['track_position']}. {t['title']} ({t['duration']}s)" for t in tracklist])
-                df.at[index, "Tracklist"] = tracklist_str
-                print(f"Fetched tracklist for {row['Album']} - {len(tracklist)} tracks")
+    with open(checkpoint_file, "a", encoding="utf-8", buffering=1) as checkpoint:
+        for index, row in df.iterrows():
+            if index in done:
+                continue  # Already processed before the previous run stopped
+
+            # Skip if tracklist already exists
+            if pd.notna(row.get("Tracklist")) and row["Tracklist"]:
+                print(f"Skipping {row['Album']} - Tracklist already exists.")
+                continue
+            
+            print(f"Processing {row['Album']} by {row['Artist Name']}...")
+            
+            # Step 1: Get album ID
+            album_id = search_deezer_album(row["Album"], row["Artist Name"])
+            df.at[index, "Deezer_ID"] = album_id
+            
+            if album_id:
+                # Step 2: Get tracklist
+                tracklist = get_album_tracklist(album_id)
+                if tracklist:
+                    # Convert tracklist to a string representation
+                    tracklist_str = "; ".join([f"{t['track_position']}. {t['title']} ({t['duration']}s)" for t in tracklist])
+                    df.at[index, "Tracklist"] = tracklist_str
+                    print(f"Fetched tracklist for {row['Album']} - {len(tracklist)} tracks")
+                else:
+                    print(f"No tracklist found for {row['Album']}")
             else:
-                print(f"No tracklist found for {row['Album']}")
-        else:
-            print(f"Album not found on Deezer: {row['Album']}")
-        
-        # Save after each album to prevent data loss in case of errors
-        df.to_csv(csv_file, index=False)
-        
-        # Rate limiting to avoid API throttling
-        time.sleep(1)
+                print(f"Album not found on Deezer: {row['Album']}")
+            
+            # Record this album so an interrupted run can resume without losing data
+            tracklist_value = df.at[index, "Tracklist"]
+            append_checkpoint(checkpoint, index, Deezer_ID=album_id,
+                              Tracklist=tracklist_value if pd.notna(tracklist_value) else None)
+            
+            # Rate limiting to avoid API throttling
+            time.sleep(1)
+
+    # Save updated CSV once; the checkpoint is then redundant
+    df.to_csv(csv_file, index=False)
+    os.remove(checkpoint_file)
     
     print(f"Finished updating CSV with album tracklists: {csv_file}")
 